@@ -6,6 +6,9 @@ version = '0.1.0'
 description = 'Solver for Sudoku puzzles that uses logic based techniques'
 install_requires = [
 ]
+extras_require = {
+    'tensor': ['numpy'],
+}
 
 
 setup(
@@ -17,4 +20,5 @@ setup(
     author_email='david.lomelin@gmail.com',
     packages=find_packages(),
     install_requires=install_requires,
+    extras_require=extras_require,
 )
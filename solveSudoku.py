@@ -1,36 +1,76 @@
 from sudoku_solver.Sudoku import Sudoku
+from sudoku_solver.SudokuBatch import solve_batch
+from sudoku_solver.SudokuCorpus import SudokuCorpus, read_puzzles
 from sudoku_solver.OptionParser import OptionParser
 
 
 def main():
     params = getParams()
 
-    sudokuObj = Sudoku(file=params.puzzle)
+    if params.batch:
+        solveBatch(params)
+    else:
+        solvePuzzle(params)
+
+
+def solvePuzzle(params):
+    sudokuObj = Sudoku(file=params.puzzle, box_size=params.boxSize)
 
     # Prints starting values
     if not params.gridValues:
         print sudokuObj
     else:
         print 'Starting'
-        printGridValues(sudokuObj.gridValues())
+        printGridValues(sudokuObj.grid_values())
 
     # Solve the puzzle
-    sudokuObj.solve()
+    sudokuObj.solve(search=params.search, engine=params.engine)
 
     # If the solver was unable to fill in all cells
     # then print out the final notes
     if not sudokuObj.complete():
-        sudokuObj.printCandidates()
+        sudokuObj.print_candidates()
 
     # Prints out final values after solving
     if not params.gridValues:
         print sudokuObj
     else:
         print 'Ending'
-        printGridValues(sudokuObj.gridValues())
+        printGridValues(sudokuObj.grid_values())
 
     if params.techniquesUsed:
-        sudokuObj.printTechniquesUsed()
+        sudokuObj.print_techniques_used()
+
+
+def solveBatch(params):
+    # A shard of the puzzles is read from the memory mapped file, so several
+    # runs can each solve their own part of the same file
+    if params.shard:
+        shardId, shardCount = [int(num) for num in params.shard.split('/')]
+        corpus = SudokuCorpus(params.batch, params.boxSize)
+        start, _ = corpus.shard_bounds(shardId, shardCount)
+        grids = corpus.shard(shardId, shardCount)
+    else:
+        start = 0
+        grids = read_puzzles(params.batch, params.boxSize)
+
+    # Prints one line per puzzle with its position in the file, the values
+    # that were found, and how the solver finished
+    results = solve_batch(
+        grids,
+        jobs=params.jobs,
+        chunk_size=params.chunkSize,
+        ordered=not params.unordered,
+        box_size=params.boxSize,
+        search=params.search,
+        engine=params.engine,
+    )
+    for index, result in results:
+        if result.solution is None:
+            values = '-'
+        else:
+            values = ''.join(''.join(row) for row in result.solution)
+        print '%s %s %s' % (start + index, values, result.status)
 
 
 def printGridValues(gridList):
@@ -61,8 +101,75 @@ def getParams():
         help = "Prints out a list of grid values in list form instead of formatted.",
     )
 
+    parser.add_option(
+        "--search",
+        action = "store_true",
+        default = False,
+        help = "Guesses the remaining values when the logic based techniques get stuck.",
+    )
+
+    parser.add_option(
+        "--engine",
+        type = "choice",
+        choices = ["logic", "tensor", "dlx"],
+        default = "logic",
+        help = "Solving engine, logic based techniques, tensor (logic with NumPy singles) "
+               "or dlx (Dancing Links).  Default: logic",
+    )
+
+    parser.add_option(
+        "--boxSize",
+        type = "int",
+        action = "store",
+        default = 3,
+        help = "Number of rows and columns in a block, 2 for 4x4 or 4 for 16x16 puzzles.  Default: 3",
+    )
+
+    parser.add_option(
+        "--batch",
+        type = "string",
+        action = "store",
+        help = "File with one puzzle per line to solve instead of --puzzle.  "
+               "Files compressed with gzip are also accepted.",
+    )
+
+    parser.add_option(
+        "--jobs",
+        type = "int",
+        action = "store",
+        default = 1,
+        help = "Number of processes used to solve the --batch puzzles, 0 for one per CPU.  "
+               "Default: 1",
+    )
+
+    parser.add_option(
+        "--chunkSize",
+        type = "int",
+        action = "store",
+        default = 100,
+        help = "Number of --batch puzzles sent to a process at a time.  Default: 100",
+    )
+
+    parser.add_option(
+        "--unordered",
+        action = "store_true",
+        default = False,
+        help = "Prints the --batch results as soon as they are finished instead of in input order.",
+    )
+
+    parser.add_option(
+        "--shard",
+        type = "string",
+        action = "store",
+        help = "Only solves shard K of N of the --batch puzzles, given as K/N with K from 0 "
+               "to N-1.  The file can not be compressed.",
+    )
+
     (options, args) = parser.parse_args()
-    parser.check_required("--puzzle")
+    if not options.batch:
+        parser.check_required("--puzzle")
+    if options.jobs == 0:
+        options.jobs = None
 
     return options
 
@@ -1,15 +1,51 @@
 '''.'''  # pylint: disable=too-many-lines
 
 import sys
-from itertools import combinations, chain
+import time
+from collections import deque, namedtuple
+from functools import partial
+from itertools import combinations, islice
 
-from sudoku_solver.utilities import instantiate_matrix, double_iter, number_set, num_dict_list
-from sudoku_solver.SudokuBlock import SudokuBlock
-from sudoku_solver.SudokuCoordinates import SudokuCoordinates
+from sudoku_solver.utilities import double_iter, cell_index, parse_num, num_symbol, \
+    candidate_mask, num_mask, mask_nums, mask_indexes, bit_count
+from sudoku_solver.SudokuGrid import SudokuGrid
+from sudoku_solver.SudokuTables import get_tables
+from sudoku_solver.SudokuDLX import get_dlx
+from sudoku_solver.SudokuTensor import get_tensor
+from sudoku_solver.SudokuCorpus import parse_puzzle_line
 
 
 class Sudoku(object):
-    ''' Class that provides interface to solving and visualizing Sudoku puzzles '''
+    '''
+    Class that provides interface to solving and visualizing Sudoku puzzles
+
+    Puzzles are loaded with either file or data.  The optional box_size is the number of
+    rows and columns in a block and defaults to 3 for the standard 9x9 grid, while 4 and
+    5 give 16x16 and 25x25 grids.  Numbers above 9 can be written with digits ('16') or
+    with letters ('G'), see utilities.SYMBOLS.
+    '''
+
+    # Names of the solving techniques, ranked from cheapest to most expensive
+    TECHNIQUES = (
+        'Singles',
+        'Candidate Lines',
+        'Multiple Lines',
+        'Naked Pairs',
+        'Hidden Pairs',
+        'X-Wing',
+        'Naked Trios',
+        'Hidden Trios',
+        'Y-Wing',
+        'Sword-Fish',
+        'XYZ-Wing',
+        'Naked Quads',
+        'Hidden Quads',
+        'Jelly-Fish',
+        'WXYZ-Wing',
+        'X-Cycles',
+        'XY-Chains',
+        'Alternating Inference Chains',
+    )
 
     def __init__(self, **kwargs):
 
@@ -45,16 +81,18 @@ class Sudoku(object):
             status = 'Incomplete'
         status = status.center(len(row_delimeter))
 
+        size = self.__tables.size
+
         string = '%s\n' % (status)
         for row in xrange(len(values)):
-            # Every 3rd block gets a delimeter
-            if row % 3 == 0:
+            # Every block of rows gets a delimeter
+            if row % size == 0:
                 string += '%s\n' % (row_delimeter)
 
             # Iterate through each number
             for col in xrange(len(values[row])):
-                # Every 3rd number gets a column delimeter
-                if col % 3 == 0:
+                # Every block of numbers gets a column delimeter
+                if col % size == 0:
                     string += '| '
 
                 string += '%s ' % (values[row][col])
@@ -71,30 +109,62 @@ class Sudoku(object):
     def grid_values(self):
         '''
         Returns a list of lists with the current grid values.
-        Unknown positions are represented by a period.
+        Unknown positions are represented by a period, and numbers above 9 by letters.
 
         :param:  None
 
         :return:  List of Lists
         '''
         values = []
+        square_size = self.__tables.size**2
+
+        # Cells are stored row by row, so every N^2-th cell starts a new row
+        for index in xrange(len(self.__tables.cells)):
+            if index % square_size == 0:
+                values.append([])
 
-        for mat_row, row in double_iter(3):
-            values.append([])
-            for mat_col, col in double_iter(3):
-                num = self.get_cell_value(mat_row, mat_col, row, col)
-                if not num:
-                    num = '.'
+            num = self.__grid.get_value(index)
+            if num:
+                num = num_symbol(num)
+            else:
+                num = '.'
 
-                values[-1].append(num)
+            values[-1].append(num)
 
         return values
 
-    def solve(self):
+    def solve(self, techniques=None, order='cost', search=False, engine='logic'):
         '''
         Attempts to figure out the values for all cells in the sudoku grid.
 
-        :param:  None
+        Techniques are run one at a time.  Whenever a technique changes the puzzle the
+        solver starts over from the first technique, and it stops as soon as the puzzle
+        is complete or no technique can make any more progress.
+
+        If search is enabled and the techniques stall, the solver guesses a value for
+        the cell with the fewest candidates and runs the techniques again inside that
+        branch, undoing the guess if it leads to a contradiction.  A Contradiction is
+        raised when every guess fails.
+
+        The 'tensor' engine runs the same techniques, but Singles is computed for the
+        whole grid at once on a NumPy candidate tensor.  Without NumPy installed it
+        falls back to the 'logic' engine.  Every Singles pass copies the grid into a
+        tensor and back, so a single puzzle is not solved any faster than with the
+        'logic' engine.  The engine pays off in solve_many(), which stacks whole
+        batches of puzzles on one tensor.
+
+        The 'dlx' engine skips the techniques altogether and finds the solution as an
+        exact cover problem with Dancing Links, which is much faster when only the
+        solution is needed.  No techniques are recorded as used, and a puzzle without
+        any solution raises a Contradiction.
+
+        :param techniques:  List of Strings - Optional names from Sudoku.TECHNIQUES to
+                            use.  Defaults to all of them.
+        :param order:  String - 'cost' runs the techniques cheapest first,
+                       'given' runs them in the order they were passed in
+        :param search:  Boolean - Guess the remaining values when the techniques stall
+        :param engine:  String - 'logic' to use the techniques, 'tensor' to use them with
+                        NumPy propagation, 'dlx' for Dancing Links
 
         :return:  None
         '''
@@ -102,45 +172,97 @@ class Sudoku(object):
         # Mark this puzzle as unsolved
         self.__set_solved_false()
 
-        while True:
-            # Mark this iteration as having no changes
-            # Any modifications to the puzzle will mark the puzzle as changed
-            # otherwise the loop will quit
-            self.__set_change_false()
+        if engine == 'dlx':
+            self.__solve_exact_cover()
+        elif engine in ('logic', 'tensor'):
+            schedule = self.__schedule_techniques(techniques, order, engine)
 
-            # Assign values to a row or column where only a single value is possible
-            self.__set_singletons()
+            self.__run_techniques(schedule)
 
-            # Reduce numbers based on lone hint pairs lying along the same row or column
-            # within 1 block.  Removes the number along the same row or column but in
-            # neighboring blocks.
-            self.__reduce_candidate_lines()
+            # Guess the values the techniques could not figure out.  When every guess
+            # fails, the puzzle has no solution.
+            if search and not self.complete() and not self.__search(schedule):
+                raise Contradiction('No solution exists for the puzzle')
+        else:
+            raise ValueError('Unknown solving engine: %s' % (engine))
 
-            # Reduce numbers based on using the xwing, swordfish, and jellyfish techniques
-            self.__reduce_xwing_sword_jelly_fish()
+        # If puzzle was complete, make sure the blocks, rows, and columns
+        # all adhere to a valid sudoku solution.
+        if self.complete():
+            self.__check_valid()
 
-            # Reduce numbers based on naked pairs/trios
-            self.__reduce_naked_sets()
+    @classmethod
+    def solve_many(cls, grids, box_size=3, batch_size=1000, **solve_kwargs):
+        '''
+        Solves a stream of puzzles, yielding the result of each one as soon as it is
+        finished.  A single Sudoku object is reloaded with every puzzle, so the grid
+        and lookup tables are reused and only one puzzle is held at a time.
+
+        With the 'tensor' engine and Singles among the techniques, puzzles are read
+        batch_size at a time and the singles of the whole batch are computed at once on
+        one candidate tensor.  Only the puzzles the singles do not finish are reloaded
+        and solved one at a time.
+
+        Each result's status is 'solved', 'unsolved' when the techniques stall,
+        'contradiction' when the puzzle has no solution, or 'invalid' when the
+        starting values can not be loaded.  The solution holds the grid values
+        reached, and is None for contradictions and invalid puzzles.
+
+        :param grids:  Iterable of Lists of Lists - Starting values of each puzzle, in
+                       the same format as the data argument
+        :param box_size:  Integer - Number of rows and columns in a block
+        :param batch_size:  Integer - Number of puzzles stacked on the tensor at a time
+        :param solve_kwargs:  Optional techniques, order, search, and engine arguments
+                              passed to solve()
+
+        :yield:  SolveResult
+        '''
+        # Every puzzle is loaded into this object, starting from an empty grid
+        square_size = box_size**2
+        sudoku_obj = cls(data=[[0] * square_size] * square_size, box_size=box_size)
+
+        # The batch only runs singles, so it is skipped when they were not requested
+        tensor = None
+        if solve_kwargs.get('engine') == 'tensor':
+            techniques = solve_kwargs.get('techniques')
+            if techniques is None or 'Singles' in techniques:
+                tensor = get_tensor(box_size)
+
+        if tensor is None:
+            for grid in grids:
+                yield sudoku_obj.__solve_grid(grid, solve_kwargs)
+            return
+
+        grid_iter = iter(grids)
+        while True:
+            grid_batch = list(islice(grid_iter, batch_size))
+            if not grid_batch:
+                break
 
-            # Reduce numbers based on using the Ywing method
-            self.__reduce_ywing()
+            for result in sudoku_obj.__solve_grid_batch(tensor, grid_batch, solve_kwargs):
+                yield result
 
-            # Reduce numbers based on using the XYZwing method
-            self.__reduce_xyz_wing()
+    def count_solutions(self, limit=2):
+        '''
+        Counts the solutions of the puzzle, starting from the values and candidates it
+        currently has.  Searching stops as soon as limit solutions have been found.
+        The puzzle itself is left unchanged.
 
-            # Reduce numbers based on using the WXYZwing method
-            self.__reduce_wxyz_wing()
+        :param limit:  Integer - Maximum number of solutions to count
 
-            # Reduce numbers based on multiple lines
-            self.__reduce_multiple_lines()
+        :return:  Integer
+        '''
+        return len(self.__exact_cover_solutions(limit))
 
-            if not self.__puzzle_changed():
-                break
+    def has_unique_solution(self):
+        '''
+        Checks if the puzzle has exactly one solution
 
-        # If puzzle was complete, make sure the blocks, rows, and columns
-        # all adhere to a valid sudoku solution.
-        if self.complete():
-            self.__check_valid()
+        :param:  None
+
+        :return:  Boolean
+        '''
+        return self.count_solutions(limit=2) == 1
 
     def complete(self):
         '''
@@ -152,16 +274,7 @@ class Sudoku(object):
         :return:  Boolean
         '''
 
-        all_complete = True
-
-        # Iterate through each of the 9 blocks
-        for block_row, block_col in double_iter(3):
-            # Check if the block is complete
-            if not self.__complete_block(block_row, block_col):
-                all_complete = False
-                break
-
-        return all_complete
+        return self.__grid.complete()
 
     def print_candidates(self, fh_out=sys.stdout):
         '''
@@ -171,32 +284,37 @@ class Sudoku(object):
 
         :return:  None
         '''
-        candidate_nums = [['1', '2', '3'], ['4', '5', '6'], ['7', '8', '9']]
+        size = self.__tables.size
+
+        # Each cell's candidates are printed as a block, Ex: [[1, 2, 3], [4, 5, 6], [7, 8, 9]]
+        candidate_nums = [range(i * size + 1, (i + 1) * size + 1) for i in xrange(size)]
 
         header = 'Current Candidates'.center(len(self.__block_row_split()))
 
         fh_out.write('%s\n' % (header))
-        for block_row in xrange(3):  # pylint: disable=too-many-nested-blocks
+        for block_row in xrange(size):  # pylint: disable=too-many-nested-blocks
             if block_row == 0:
                 fh_out.write('%s\n' % (self.__block_row_split()))
-            for row in xrange(3):
+            for row in xrange(size):
                 for i in xrange(len(candidate_nums)):
                     fh_out.write('||')
-                    for block_col, col in double_iter(3):
+                    for block_col, col in double_iter(size):
                         num_string = ''
-                        candidates = self.get_cell_candidates(block_row, block_col, row, col)
+                        candidates = self.__get_candidates(
+                            cell_index(block_row, block_col, row, col, size),
+                        )
                         for num in candidate_nums[i]:
-                            if num in candidates:
-                                num_string += '%s' % (num)
+                            if candidates & num_mask(num):
+                                num_string += num_symbol(num)
                             else:
                                 num_string += ' '
-                        if col == 2:
+                        if col == size - 1:
                             col_split = '||'
                         else:
                             col_split = '|'
                         fh_out.write(' %s %s' % (num_string, col_split))
                     fh_out.write('\n')
-                if row == 2:
+                if row == size - 1:
                     fh_out.write('%s\n' % (self.__block_row_split()))
                 else:
                     fh_out.write('%s\n' % (self.__row_split()))
@@ -217,16 +335,18 @@ class Sudoku(object):
 
     def get_cell_value(self, block_row, block_col, row, col):
         '''
-        Returns the value of a cell at the specified coordinates
+        Returns the value of a cell at the specified coordinates, or 0 if it is unknown
 
         :param block_row:  Integer
         :param block_col:  Integer
         :param row:  Integer
         :param col:  Integer
 
-        :return:  String (integer)
+        :return:  Integer
         '''
-        return self.__matrix[block_row][block_col].get_value(row, col)
+        return self.__grid.get_value(
+            cell_index(block_row, block_col, row, col, self.__tables.size),
+        )
 
     def get_cell_candidates(self, block_row, block_col, row, col):
         '''
@@ -237,20 +357,203 @@ class Sudoku(object):
         :param row:  Integer
         :param col:  Integer
 
-        :return:  Set of integers cast as strings
+        :return:  Set of integers
+        '''
+        index = cell_index(block_row, block_col, row, col, self.__tables.size)
+        return set(mask_nums(self.__get_candidates(index)))
+
+    def checkpoint(self):
+        '''
+        Marks the current values, candidates, and techniques used so they can be
+        restored with rollback().  Every change made afterwards is recorded, so
+        rolling back only undoes those changes instead of reloading the puzzle.
+
+        :param:  None
+
+        :return:  Object - Mark to pass to rollback()
+        '''
+        # Finish any queued placements so the mark covers a consistent grid
+        self.__propagate()
+
+        return (self.__grid.checkpoint(), dict(self.__techniques_used))
+
+    def rollback(self, mark):
+        '''
+        Restores the puzzle to the state it was in when checkpoint() returned mark
+
+        :param mark:  Object - Returned by checkpoint()
+
+        :return:  None
         '''
-        return self.__matrix[block_row][block_col].get_candidates(row, col)
+        grid_mark, techniques_used = mark
+
+        self.__grid.rollback(grid_mark)
+        self.__pending.clear()
+        self.__wing_cells = None  # pylint: disable=attribute-defined-outside-init
+        self.__techniques_used = dict(techniques_used)
+
+        # Mark this puzzle as unsolved
+        self.__set_solved_false()
 
     ###################
     # Private Methods #
     ###################
 
+    def __schedule_techniques(self, techniques, order, engine='logic'):
+        ''' Returns the methods for the requested techniques in the order they are run '''
+        if techniques is None:
+            techniques = self.TECHNIQUES
+
+        methods = self.__technique_methods()
+
+        # Singles are computed on the candidate tensor when NumPy is available
+        tensor = get_tensor(self.__tables.size) if engine == 'tensor' else None
+        if tensor is not None:
+            methods['Singles'] = partial(self.__tensor_singles, tensor)
+        for technique in techniques:
+            if technique not in methods:
+                raise ValueError('Unknown technique: %s' % (technique))
+
+        if order == 'cost':
+            techniques = sorted(techniques, key=self.TECHNIQUES.index)
+        elif order != 'given':
+            raise ValueError('Unknown technique order: %s' % (order))
+
+        return [methods[technique] for technique in techniques]
+
+    def __run_techniques(self, schedule):
+        ''' Runs the scheduled techniques until the puzzle is complete or they stall '''
+        position = 0
+        while position < len(schedule) and not self.complete():
+            # Mark this technique as having made no changes
+            # Any modifications to the puzzle will mark the puzzle as changed
+            self.__set_change_false()
+
+            schedule[position]()
+
+            # Finish updating the cells affected by any placements before
+            # running the next technique
+            self.__propagate()
+
+            # Restart from the cheapest technique after any progress
+            if self.__puzzle_changed():
+                position = 0
+            else:
+                position += 1
+
+    def __search(self, schedule):
+        '''
+        Guesses each candidate of the cell with the fewest candidates, running the
+        techniques after every guess.  Guesses that lead to a contradiction are rolled
+        back.  Returns True once the puzzle is complete, otherwise the puzzle is left
+        as it was before searching.
+        '''
+        index = self.__fewest_candidates_cell()
+
+        for num in mask_nums(self.__get_candidates(index)):
+            mark = self.checkpoint()
+            try:
+                self.__set_value(num, index)
+                self.__run_techniques(schedule)
+                if self.complete() or self.__search(schedule):
+                    return True
+            except Contradiction:
+                pass
+            self.rollback(mark)
+
+        return False
+
+    def __solve_exact_cover(self):
+        '''
+        Fills in the grid with the first solution found by Dancing Links.  A puzzle
+        without any solution raises a Contradiction.
+        '''
+        solutions = self.__exact_cover_solutions(1)
+        if not solutions:
+            raise Contradiction('No solution exists for the puzzle')
+
+        for index, num in enumerate(solutions[0]):
+            if not self.__get_value(index):
+                self.__grid.set_value(num, index)
+                self.__grid.clear_candidates(index)
+        self.__set_change_true(None)
+
+    def __exact_cover_solutions(self, limit):
+        '''
+        Returns up to limit solutions found by Dancing Links.  Only the candidates left
+        in the grid are tried, so every elimination made so far narrows the search.
+        '''
+        self.__propagate()
+
+        cell_count = len(self.__tables.cells)
+        values = [self.__get_value(index) for index in xrange(cell_count)]
+        candidates = [self.__get_candidates(index) for index in xrange(cell_count)]
+
+        return get_dlx(self.__tables.size).solve(values, candidates, limit)
+
+    def __fewest_candidates_cell(self):
+        ''' Returns the index of the unassigned cell with the fewest candidates '''
+        best_index = None
+        best_count = None
+        for index in xrange(len(self.__tables.cells)):
+            candidates = self.__get_candidates(index)
+            if candidates:
+                count = bit_count(candidates)
+                if best_count is None or count < best_count:
+                    best_index, best_count = index, count
+                    if count == 2:
+                        break
+        return best_index
+
+    def __technique_methods(self):
+        ''' Maps each technique name to the method that runs it '''
+        return {
+            # Assign values to a row or column where only a single value is possible
+            'Singles': self.__set_singletons,
+
+            # Reduce numbers based on lone hint pairs lying along the same row or column
+            # within 1 block.  Removes the number along the same row or column but in
+            # neighboring blocks.
+            'Candidate Lines': self.__reduce_candidate_lines,
+
+            # Reduce numbers based on multiple lines
+            'Multiple Lines': self.__reduce_multiple_lines,
+
+            # Reduce numbers based on naked pairs/trios/quads
+            'Naked Pairs': partial(self.__reduce_naked_sets, 2),
+            'Naked Trios': partial(self.__reduce_naked_sets, 3),
+            'Naked Quads': partial(self.__reduce_naked_sets, 4),
+
+            # Reduce numbers based on hidden pairs/trios/quads
+            'Hidden Pairs': partial(self.__reduce_hidden_sets, 2),
+            'Hidden Trios': partial(self.__reduce_hidden_sets, 3),
+            'Hidden Quads': partial(self.__reduce_hidden_sets, 4),
+
+            # Reduce numbers based on using the xwing, swordfish, and jellyfish techniques
+            'X-Wing': partial(self.__reduce_xwing_sword_jelly_fish, 2),
+            'Sword-Fish': partial(self.__reduce_xwing_sword_jelly_fish, 3),
+            'Jelly-Fish': partial(self.__reduce_xwing_sword_jelly_fish, 4),
+
+            # Reduce numbers based on using the Ywing, XYZwing, and WXYZwing methods
+            'Y-Wing': self.__reduce_ywing,
+            'XYZ-Wing': self.__reduce_xyz_wing,
+            'WXYZ-Wing': self.__reduce_wxyz_wing,
+
+            # Reduce numbers based on chains of strong and weak links
+            'X-Cycles': partial(self.__reduce_chains, 'X-Cycles', False, True, False),
+            'XY-Chains': partial(self.__reduce_chains, 'XY-Chains', True, False, False),
+            'Alternating Inference Chains': partial(
+                self.__reduce_chains, 'Alternating Inference Chains', True, True, True,
+            ),
+        }
+
     def __puzzle_changed(self):
         return self.__change_status
 
     def __set_change_true(self, technique_used):
         ''' Lets the solver know changes were made '''
         self.__change_status = True  # pylint: disable=attribute-defined-outside-init
+        self.__wing_cells = None  # pylint: disable=attribute-defined-outside-init
         self.__track_techniques_used(technique_used)
 
     def __set_change_false(self):
@@ -269,148 +572,88 @@ class Sudoku(object):
             except KeyError:
                 self.__techniques_used[technique] = 1
 
-    def __delete_candidate_number(  # pylint: disable=too-many-arguments
-            self,
-            num,
-            block_row,
-            block_col,
-            row,
-            col):
-        self.__matrix[block_row][block_col].delete_candidate_number(num, row, col)
-
-    def __set_cell_value(  # pylint: disable=too-many-arguments
-            self,
-            num,
-            block_row,
-            block_col,
-            row,
-            col):
-        ''' Sets the value of the specified cell '''
-        self.__matrix[block_row][block_col].set_value(num, row, col)
+    def __get_value(self, index):
+        ''' Returns the value of the cell at index, or 0 if it is unknown '''
+        return self.__grid.get_value(index)
 
-    def __clear_cell_candidates(self, block_row, block_col, row, col):
-        ''' Clears out available candidates from the specified cell '''
-        self.__matrix[block_row][block_col].clear_candidates(row, col)
+    def __get_candidates(self, index):
+        ''' Returns the bitmask of candidates of the cell at index '''
+        return self.__grid.get_candidates(index)
 
-    def __complete_block(self, block_row, block_col):
-        return self.__matrix[block_row][block_col].complete()
-
-    def __set_value(  # pylint: disable=too-many-arguments
-            self,
-            num,
-            block_row,
-            block_col,
-            row,
-            col,
-            technique_used=None):
+    def __set_value(self, num, index, technique_used=None):
         '''
-        Sets the value of the specified cell and adjusts the candidates in the
-        necessary row, column, and block.
+        Sets the value of the specified cell and clears its candidates.  Removing the
+        number from the necessary row, column, and block is queued for __propagate.
         '''
 
-        # Sets the value of the specified cell
-        self.__set_cell_value(num, block_row, block_col, row, col)
+        # The number can not be assigned twice within a row, column, or block
+        num_bit = num_mask(num)
+        for unit, _ in self.__tables.cell_unit_positions[index]:
+            if self.__grid.get_placed(unit) & num_bit:
+                raise Contradiction('%s is already assigned within unit %s' % (num, unit))
 
-        # Clears out available candidates from the specified cell
-        self.__clear_cell_candidates(block_row, block_col, row, col)
+        # Sets the value of the specified cell and clears out its available candidates
+        self.__grid.set_value(num, index)
+        self.__grid.clear_candidates(index)
 
-        # Clears out available candidates from the affected block, row, and column
-        self.__remove_candidate_seen_by(num, block_row, block_col, row, col)
+        # Queue the placement so the cells that see this one get updated
+        self.__pending.append((index, num))
 
         # Let the solver know changes were made
         self.__set_change_true(technique_used)
 
-    def __clear_cell_candidate_and_set(  # pylint: disable=too-many-arguments
-            self,
-            num,
-            block_row,
-            block_col,
-            row,
-            col,
-            technique_used):
+        # Update the cells that see this one before the grid is read again
+        self.__propagate()
+
+    def __clear_cell_candidate_and_set(self, num, index, technique_used):
         '''
         Deletes the specified number from the cell's candidates.  If there is only
-        one number left in the candidates, then it sets the value
-        '''
-
-        candidates = self.get_cell_candidates(block_row, block_col, row, col)
-        if num in candidates:
-            self.__delete_candidate_number(num, block_row, block_col, row, col)
-
-            nums = list(candidates)
-            if len(nums) == 1:
-                self.__set_value(
-                    nums[0],
-                    block_row,
-                    block_col,
-                    row,
-                    col,
-                    technique_used,
-                )
+        one number left in the candidates, then it sets the value.  Removing the last
+        candidate of an unassigned cell raises a Contradiction.
+        '''
+
+        candidates = self.__grid.get_candidates(index)
+        num_bit = num_mask(num)
+        if candidates & num_bit:
+            self.__grid.delete_candidate_number(num, index)
+
+            remaining = candidates & ~num_bit
+            if not remaining:
+                raise Contradiction('No candidates left for cell %s' % (index))
+            elif bit_count(remaining) == 1:
+                self.__set_value(next(mask_nums(remaining)), index, technique_used)
             else:
                 # Let the solver know changes were made
                 self.__set_change_true(technique_used)
 
-    def __find_unassigned_nums(self, cell_coordinates_list):
+    def __propagate(self):
         '''
-        Iterate through each cell, determine which numbers have already been
-        assigned, and remove them from the list of unassigned numbers
+        Works through the queue of pending placements.  Each placement only touches the
+        cells in its row, column, and block, and cells left with a single candidate are
+        placed and queued in turn rather than recursing.
         '''
+        # Placements made while propagating are picked up by the running loop
+        if self.__propagating:
+            return
 
-        # Create a list of all possible numbers that can be assigned to the current set of cells
-        unassigned_nums = number_set(3)
-
-        # Iterate through each cell's coordinates
-        for cell_coords in cell_coordinates_list:
-
-            # Remove the already assigned number in the current cell
-            # from the list of possible numbers
-            num = self.get_cell_value(
-                cell_coords.block_row,
-                cell_coords.block_col,
-                cell_coords.row,
-                cell_coords.col,
-            )
-            if num:
-                unassigned_nums.discard(num)
-
-        return unassigned_nums
-
-    def __remove_candidate_seen_by(  # pylint: disable=too-many-arguments
-            self,
-            num,
-            block_row,
-            block_col,
-            row,
-            col):
-        ''' Clears out available candidates from the affected block, row, and column '''
-
-        # Remove the number from the candidates along the block
-        self.__remove_candidate_by_iter(
-            num,
-            self.__block_cell_coords_iter,
-            block_row,
-            block_col,
-            [],
-        )
+        self.__propagating = True  # pylint: disable=attribute-defined-outside-init
+        try:
+            pending = self.__pending
+            while pending:
+                index, num = pending.popleft()
 
-        # Remove the number from the candidates along the row
-        self.__remove_candidate_by_iter(
-            num,
-            self.__row_cell_coords_iter,
-            block_row,
-            row,
-            [],
-        )
+                # Remove the number from the candidates of every cell that sees this one
+                for coords in self.__tables.peers[index]:
+                    self.__clear_cell_candidate_and_set(num, coords.cell_index, None)
+        finally:
+            self.__propagating = False  # pylint: disable=attribute-defined-outside-init
 
-        # Remove the number from the candidates along the column
-        self.__remove_candidate_by_iter(
-            num,
-            self.__col_cell_coords_iter,
-            block_col,
-            col,
-            [],
-        )
+    def __find_unassigned_nums(self, unit):
+        '''
+        Returns the numbers that have not been assigned yet in the unit,
+        read from the grid's unit index
+        '''
+        return candidate_mask(self.__tables.size) & ~self.__grid.get_placed(unit)
 
     def __remove_candidate_by_iter(  # pylint: disable=too-many-arguments
             self,
@@ -430,23 +673,12 @@ class Sudoku(object):
             # Skip the cells that are the skip list
             if not self.__coords_in_list(coords, skip_coords_list):
                 # Remove the numbers from the cell candidates
-                self.__clear_cell_candidate_and_set(
-                    num,
-                    coords.block_row,
-                    coords.block_col,
-                    coords.row,
-                    coords.col,
-                    technique,
-                )
+                self.__clear_cell_candidate_and_set(num, coords.cell_index, technique)
 
     @staticmethod
     def __coords_in_list(coords, skip_list):
-        item_in_list = False
-        for item in skip_list:
-            if item == coords:
-                item_in_list = True
-                break
-        return item_in_list
+        # Coordinates are interned, so membership is an identity check
+        return coords in skip_list
 
     def __coords_intersection(self, *coords_list):
         seen_coords_list = []
@@ -462,63 +694,10 @@ class Sudoku(object):
 
     def __coords_seen_by(self, center_coord):
         '''
-        Returns a set of all coordinates that are in the same
+        Returns a frozenset of all coordinates that are in the same
         block, row, and column as the input coordinates
         '''
-        unique_coords = set()
-
-        # Store all coordinates in the same block as center_coord
-        for coord in self.__block_cell_coords_iter(center_coord.block_row, center_coord.block_col):
-            unique_coords.add(coord)
-
-        # Store all coordinates in the same row as center_coord
-        for coord in self.__row_cell_coords_iter(center_coord.block_row, center_coord.row):
-            unique_coords.add(coord)
-
-        # Store all coordinates in the same column as center_coord
-        for coord in self.__col_cell_coords_iter(center_coord.block_col, center_coord.col):
-            unique_coords.add(coord)
-
-        # Remove center_coord
-        unique_coords.discard(center_coord)
-
-        return unique_coords
-
-    def __valid_cells_seen_by(self, coords, pivot_cell_candidates, valid_cell_function):
-        coords_list = []
-        candidates_list = []
-
-        # Iterate across all cells that are seen by the current cell
-        for cell_coords in self.__coords_seen_by(coords):
-
-            # Look for cells that pass the criteria set forth by valid_cell_function
-            cell_candidates = self.get_cell_candidates(
-                cell_coords.block_row,
-                cell_coords.block_col,
-                cell_coords.row,
-                cell_coords.col,
-            )
-            if valid_cell_function(pivot_cell_candidates, cell_candidates):
-                coords_list.append(cell_coords)
-                candidates_list.append(cell_candidates)
-
-        return coords_list, candidates_list
-
-    @staticmethod
-    def __candidates_intersection(*candidates_list):
-        candidates_intersection = candidates_list[0]
-        for i in xrange(1, len(candidates_list)):
-            candidates_intersection = candidates_intersection.intersection(candidates_list[i])
-
-        return candidates_intersection
-
-    @staticmethod
-    def __candidates_union(*candidates_list):
-        candidates_union = candidates_list[0]
-        for i in xrange(1, len(candidates_list)):
-            candidates_union = candidates_union.union(candidates_list[i])
-
-        return candidates_union
+        return self.__tables.peers[center_coord.cell_index]
 
     @staticmethod
     def __check_input_arguments(fields_to_check, kwargs):
@@ -537,6 +716,11 @@ class Sudoku(object):
 
     def __load_input_data(self, kwargs):
         ''' Loads the user specified data '''
+        # Lookup tables for the grid size, shared by every puzzle of the same size
+        self.__tables = get_tables(  # pylint: disable=attribute-defined-outside-init
+            kwargs.get('box_size', 3),
+        )
+
         if 'file' in kwargs:
             # Parses file with starting Sudoku numbers and loads object
             self.__load_from_file(kwargs['file'])
@@ -545,167 +729,278 @@ class Sudoku(object):
             self.__load_from_data(kwargs['data'])
 
     def __load_from_file(self, file_name):
-        ''' Loads data from a file '''
-        data = []
-
-        # Converts file contents into a list of lists
+        ''' Loads data from a file with either one line per row or the whole puzzle on one line '''
         fh_in = open(file_name, 'rU')
-        for line in fh_in:
-            nums = self.__parse_file_line(line)
-            data.append(nums)
+        lines = fh_in.readlines()
         fh_in.close()
 
+        # A file with a single line holding every row is a single line puzzle
+        square_size = self.__tables.size**2
+        data = parse_puzzle_line(lines[0], self.__tables.size) if len(lines) == 1 else None
+
+        # Otherwise converts file contents into a list of lists
+        if data is None or len(data) != square_size:
+            data = [self.__parse_file_line(line, square_size) for line in lines]
+
         # Loads data from a list of lists
         self.__load_from_data(data)
 
     # Loads data from a list of lists
     def __load_from_data(self, data):
-        temp_matrix = instantiate_matrix(3)
-        current_block_row = 0
+        self.__instantiate_sudoku_grid(self.__parse_rows(data))
 
-        for nums in data:
-            # Every 3 lines get incremented
-            if self.__current_block_row_full(temp_matrix, current_block_row):
-                current_block_row += 1
-
-            temp_matrix[current_block_row][0].append(nums[0:3])
-            temp_matrix[current_block_row][1].append(nums[3:6])
-            temp_matrix[current_block_row][2].append(nums[6:9])
-
-        self.__instantiate_sudoku_matrix(temp_matrix)
+    def __parse_rows(self, data):
+        ''' Converts text into integers, with 0 for unknown positions '''
+        square_size = self.__tables.size**2
+        return [[parse_num(num) for num in nums[0:square_size]] for nums in data]
 
     @staticmethod
-    def __parse_file_line(line):
-        ''' Parses the line of a file into a valid list '''
+    def __parse_file_line(line, square_size):
+        '''
+        Parses the line of a file into a valid list.  Every character is a cell, unless
+        the line is separated by commas to allow numbers with more than one digit.
+        Ex: '97 652  8' or '16,,3,.,...'
+        '''
         # Strip newline character
         line = line.strip('\n')
 
+        if ',' in line:
+            return line.split(',')
+
         # Periods are allowed for unknown positions by converting them to spaces
         line = line.replace('.', ' ')
 
-        # Make sure there are at least 9 positions in the line
+        # Make sure there is a position for every column in the line
         # Right padded spaces will be turned into unknowns
-        line = line.ljust(9)
+        line = line.ljust(square_size)
 
         # Convert to a list of numbers
         return list(line)
 
-    @staticmethod
-    def __current_block_row_full(matrix, block_row):
-        ''' Returns True if the current row of blocks are all full '''
-        return len(matrix[block_row][0]) == 3 and \
-            len(matrix[block_row][1]) == 3 and \
-            len(matrix[block_row][2]) == 3
+    def __instantiate_sudoku_grid(self, rows):
+        ''' Stores the rows in a flat SudokuGrid object '''
 
-    def __instantiate_sudoku_matrix(self, temp_matrix):
-        ''' Converts the temporary matrix into one that has SudokuBlock objects '''
+        self.__grid = SudokuGrid(rows)  # pylint: disable=attribute-defined-outside-init
+        self.__check_box_size()
 
-        self.__matrix = instantiate_matrix(3)  # pylint: disable=attribute-defined-outside-init
-        # Iterate through each of the 9 blocks
-        for block_row, block_col in double_iter(3):
-            self.__matrix[block_row][block_col] = SudokuBlock(temp_matrix[block_row][block_col])
+        # Placements whose row, column, and block still need their candidates updated
+        self.__pending = deque()  # pylint: disable=attribute-defined-outside-init
+        self.__propagating = False  # pylint: disable=attribute-defined-outside-init
+
+        # Cells used by the wing techniques, built when they are first needed
+        self.__wing_cells = None  # pylint: disable=attribute-defined-outside-init
 
         # Adjusts the candidates based on the initial values of the sudoku grid.
         self.__clear_initial_candidates()
 
+    def __reload(self, data):
+        '''
+        Replaces the puzzle with another one of the same size, reusing the grid
+        and the queue of pending placements that were already allocated
+        '''
+        self.__grid.reset(self.__parse_rows(data))
+        self.__check_box_size()
+
+        self.__pending.clear()
+        self.__wing_cells = None  # pylint: disable=attribute-defined-outside-init
+        self.__techniques_used = {}  # pylint: disable=attribute-defined-outside-init
+
+        # Mark this puzzle as unsolved
+        self.__set_solved_false()
+
+        # Adjusts the candidates based on the initial values of the sudoku grid.
+        self.__clear_initial_candidates()
+
+    def __solve_grid(self, grid, solve_kwargs):
+        ''' Reloads the object with the grid and solves it, returning a SolveResult '''
+        start = time.time()
+        try:
+            try:
+                self.__reload(grid)
+            except ValueError:
+                return SolveResult(None, 'invalid', {}, time.time() - start)
+
+            self.solve(**solve_kwargs)
+        except Contradiction:
+            return SolveResult(None, 'contradiction', {}, time.time() - start)
+
+        status = 'solved' if self.complete() else 'unsolved'
+        return SolveResult(
+            self.grid_values(),
+            status,
+            dict(self.__techniques_used),
+            time.time() - start,
+        )
+
+    def __solve_grid_batch(self, tensor, grids, solve_kwargs):
+        '''
+        Runs the singles of every puzzle at once on the candidate tensor, then solves
+        the puzzles that are left unfinished one at a time, starting from the values
+        the singles found.  Puzzles that can not be stacked or that the tensor finds
+        no solution for are solved from the start, so they get the same status as
+        any other puzzle.  Every puzzle is charged an equal share of the tensor's time.
+        '''
+        start = time.time()
+        size = self.__tables.size
+        square_size = size**2
+
+        # Only puzzles with a valid shape and numbers can be stacked
+        stacked = []
+        values_list = []
+        for position, grid in enumerate(grids):
+            values = [num for row in self.__parse_rows(grid) for num in row]
+            if (len(grid) == square_size and len(values) == square_size**2 and
+                    max(values) <= square_size):
+                stacked.append(position)
+                values_list.append(values)
+
+        masks_list = [None] * len(grids)
+        if stacked:
+            puzzle_tensor = tensor.to_tensor(values_list)
+            valid = tensor.reduce(puzzle_tensor)
+            for position, masks, is_valid in zip(stacked, tensor.to_masks(puzzle_tensor), valid):
+                if is_valid:
+                    masks_list[position] = masks
+
+        share = (time.time() - start) / len(grids)
+
+        for grid, masks in zip(grids, masks_list):
+            if masks is None:
+                yield self.__solve_grid(grid, solve_kwargs)
+                continue
+
+            # Only assigned cells are left with a single candidate
+            values = [mask.bit_length() if bit_count(mask) == 1 else 0 for mask in masks]
+            rows = [values[row:row + square_size] for row in xrange(0, len(values), square_size)]
+
+            if 0 in values:
+                result = self.__solve_grid(rows, solve_kwargs)
+                yield result._replace(seconds=result.seconds + share)
+            else:
+                solution = [[num_symbol(num) for num in row] for row in rows]
+                yield SolveResult(solution, 'solved', {}, share)
+
+    def __check_box_size(self):
+        ''' Makes sure the grid has as many rows as the box size requires '''
+        if self.__grid.box_size() != self.__tables.size:
+            raise ValueError(
+                'Invalid number of rows passed to Sudoku object.  '
+                'A box size of %s requires %s rows.' % (
+                    self.__tables.size, self.__tables.size**2,
+                )
+            )
+
     # Adjusts the candidates based on the initial values of the sudoku grid.
     def __clear_initial_candidates(self):
 
-        # Iterate through each block in the sudoku grid
-        for cell_coordinates_list in self.__block_coords_iter():
+        # Iterate through each cell
+        for index in xrange(len(self.__tables.cells)):
 
-            # Iterate through each cell's coordinates
-            for cell_coords in cell_coordinates_list:
+            # If the cell has a number assigned then queue it so the block, row,
+            # and column candidates get cleared
+            num = self.__grid.get_value(index)
+            if num:
+                self.__pending.append((index, num))
 
-                # If the cell has a number assigned then clear the block, row, and column candidates
-                num = self.get_cell_value(
-                    cell_coords.block_row,
-                    cell_coords.block_col,
-                    cell_coords.row,
-                    cell_coords.col,
-                )
-                if num:
-                    # Clears out available candidates from the affected block, row, and column
-                    self.__remove_candidate_seen_by(
-                        num,
-                        cell_coords.block_row,
-                        cell_coords.block_col,
-                        cell_coords.row,
-                        cell_coords.col,
-                    )
+        # Clears out available candidates from the affected blocks, rows, and columns
+        self.__propagate()
 
-    @staticmethod
-    def __row_delimeter():
-        return '-------------------------'
+    def __row_delimeter(self):
+        # Ex: '-------------------------' for a 9x9 grid
+        size = self.__tables.size
+        return '-' * (size * (2 * size + 2) + 1)
 
-    @staticmethod
-    def __row_split():
-        return '-----------------------------------------------------------'
+    def __row_split(self):
+        # Ex: '-----------------------------------------------------------' for a 9x9 grid
+        return '-' * self.__candidate_line_length()
 
-    @staticmethod
-    def __block_row_split():
-        return '==========================================================='
+    def __block_row_split(self):
+        # Ex: '===========================================================' for a 9x9 grid
+        return '=' * self.__candidate_line_length()
+
+    def __candidate_line_length(self):
+        ''' Length of a line written by print_candidates '''
+        size = self.__tables.size
+        return size**2 * (size + 3) + size + 2
 
     def __set_singletons(self):
-        # Assign singletons within rows
-        self.__set_singleton_candidates(self.__row_coords_iter)
+        '''
+        Single stage that assigns every naked single (a cell with one candidate left)
+        and every hidden single (a number with one position left in a row, column,
+        or block).  Both are read straight from the grid's candidates and unit index.
+        '''
+        # Assign naked singles
+        self.__set_naked_singles()
 
-        # Assign singletons within columns
-        self.__set_singleton_candidates(self.__column_coords_iter)
+        # Assign hidden singles within rows, columns, and blocks
+        self.__set_singleton_candidates(self.__tables.unit_ids)
 
-    def __set_singleton_candidates(self, coord_iter):
+    def __tensor_singles(self, tensor):
+        '''
+        Same as __set_singletons, but the eliminations, naked singles, and hidden singles are
+        computed together on the candidate tensor and then copied back into the grid.
+        The tensor only stops once every assigned number has been removed from the
+        cells that see it, so the grid can be updated without propagating again.
+        '''
+        self.__propagate()
 
-        # Iterate through each line in the sudoku grid
-        # The lines will be all rows or all columns, depending on what was passed
-        # to this method in coord_iter
-        for cell_coordinates_list in coord_iter():  # pylint: disable=too-many-nested-blocks
+        cell_count = len(self.__tables.cells)
+        values = [self.__get_value(index) for index in xrange(cell_count)]
+        candidates = [self.__get_candidates(index) for index in xrange(cell_count)]
 
-            # Generate list of numbers that can still be assigned to the
-            # remaining cells in the row or column
-            unassigned_nums = self.__find_unassigned_nums(cell_coordinates_list)
-
-            # Iterate through the set of unassigned numbers
-            for current_value in unassigned_nums:
-
-                available_cell_count = 0
-                available_cell_coords = None
-
-                # Iterate through each cell's coordinates
-                for cell_coords in cell_coordinates_list:
-
-                    # If that position was already assigned a number then skip it
-                    if not self.get_cell_value(
-                            cell_coords.block_row,
-                            cell_coords.block_col,
-                            cell_coords.row,
-                            cell_coords.col):
-                        # Grab the set() of available values for the current cell
-                        candidates = self.get_cell_candidates(
-                            cell_coords.block_row,
-                            cell_coords.block_col,
-                            cell_coords.row,
-                            cell_coords.col,
-                        )
-                        # Keep track of how many positions will allow the current value
-                        if current_value in candidates:
-                            available_cell_count += 1
-                            available_cell_coords = cell_coords
+        masks = tensor.propagate(values, candidates)
+        if masks is None:
+            raise Contradiction('Singles left the puzzle without a solution')
+
+        for index, mask in enumerate(masks):
+            if values[index] or mask == candidates[index]:
+                continue
+
+            if bit_count(mask) == 1:
+                self.__grid.set_value(mask.bit_length(), index)
+                self.__grid.clear_candidates(index)
+            else:
+                self.__grid.restrict_candidates(mask, index)
+
+            # Let the solver know changes were made
+            self.__set_change_true(None)
 
-                            # Once the available cell count is greater than 1, there is no point
-                            # in going forward because we need singletons
-                            if available_cell_count > 1:
-                                break
+    def __set_naked_singles(self):
+        # Iterate through each cell in the sudoku grid
+        for index in xrange(len(self.__tables.cells)):
+
+            # A cell that is down to 1 candidate must be that number
+            candidates = self.__get_candidates(index)
+            if candidates and bit_count(candidates) == 1:
+                self.__set_value(candidates.bit_length(), index)
+
+    def __set_singleton_candidates(self, unit_ids):
+
+        # Iterate through each unit in the sudoku grid
+        # The units will be rows, columns, and blocks, depending on what was passed
+        # to this method in unit_ids
+        for unit in unit_ids:
+
+            # Iterate through the set of numbers that can still be assigned to the
+            # remaining cells in the unit
+            for current_value in mask_nums(self.__find_unassigned_nums(unit)):
+
+                # Look up the positions in the unit that still allow the current value
+                positions = self.__grid.get_positions(unit, current_value)
+
+                # Earlier placements may have already assigned the value in this unit
+                if not positions:
+                    if self.__grid.get_placed(unit) & num_mask(current_value):
+                        continue
+                    raise Contradiction(
+                        'No cells left for %s within unit %s' % (current_value, unit)
+                    )
 
                 # Assuming there is only 1 cell that can accept the current value
                 # then set that cell's value
-                if available_cell_count == 1:
-                    self.__set_value(
-                        current_value,
-                        available_cell_coords.block_row,
-                        available_cell_coords.block_col,
-                        available_cell_coords.row,
-                        available_cell_coords.col,
-                    )
+                if bit_count(positions) == 1:
+                    coords = self.__tables.units[unit][positions.bit_length() - 1]
+                    self.__set_value(current_value, coords.cell_index)
 
     def __reduce_candidate_lines(self):
         '''
@@ -715,19 +1010,18 @@ class Sudoku(object):
         technique = 'Candidate Lines'
 
         # Iterate through all sudoku grid blocks
-        for cell_coordinates_list in self.__block_coords_iter():
-            # Create a list of all unassigned numbers and the coordinates where they are found
-            hint_coords = self.__generate_hint_coords(cell_coordinates_list)
+        for unit in self.__tables.block_ids:
+            cell_coordinates_list = self.__tables.units[unit]
 
             # Iterate through each unassigned number
-            for num in hint_coords:
+            for num in mask_nums(self.__find_unassigned_nums(unit)):
 
                 # Candidate lines method works by aligning
-                if len(hint_coords[num]) == 2:
+                positions = self.__grid.get_positions(unit, num)
+                if bit_count(positions) == 2:
 
                     # Store variables just to make code more readable
-                    coords1 = hint_coords[num][0]
-                    coords2 = hint_coords[num][1]
+                    coords1, coords2 = [cell_coordinates_list[i] for i in mask_indexes(positions)]
 
                     # Candidate line lies along a row, therefore
                     # remove number from the rest of the row
@@ -755,172 +1049,84 @@ class Sudoku(object):
                             technique,
                         )
 
-    # Stores the coordinates for all hint positions
-    def __generate_hint_coords(self, cell_coordinates_list):
-        hint_coords = num_dict_list(3)
-
-        # Iterate through each cell's coordinates
-        for cell_coords in cell_coordinates_list:
-            # Store the coordinates where all numbers are found
-            candidates = self.get_cell_candidates(
-                cell_coords.block_row,
-                cell_coords.block_col,
-                cell_coords.row,
-                cell_coords.col,
-            )
-            for num in candidates:
-                hint_coords[num].append(cell_coords)
-
-        return hint_coords
-
-    def __reduce_xwing_sword_jelly_fish(self):
+    def __reduce_xwing_sword_jelly_fish(self, cell_count):
 
         # 2 = Xwing  3 = Swordfish  4 = Jellyfish
-        for cell_count in xrange(2, 5):
-            # Search for valid xwing cells along rows to reduce candidates along the columns
-            self.__reduce_xwing_sword_jelly_row(cell_count)
-
-            # Search for valid xwing cells along columns to reduce candidates along the rows
-            self.__reduce_xwing_sword_jelly_col(cell_count)
-
-    def __reduce_xwing_sword_jelly_row(self, cell_count):
         technique = self.__x_sword_jelly_technique(cell_count)
-        potential_cells = self.__potential_rectangle_cells(cell_count, self.__row_coords_iter)
-
-        # Iterate through each number
-        for num in potential_cells:
-
-            # Iterate through all possible row triplets
-            for dataset in combinations(potential_cells[num], cell_count):
 
-                # Checks if the current triplet of rows forms a valid Swordfish across 3 columns
-                if self.__valid_rectangle_col_cells(cell_count, *dataset):
+        # Search for fish along rows to reduce candidates along the columns
+        self.__find_fish(cell_count, self.__tables.row_ids, self.__tables.column_ids, technique)
 
-                    # Iterate through the 3 affected columns
-                    for block_coords in self.__columns_in_common(*dataset):
+        # Search for fish along columns to reduce candidates along the rows
+        self.__find_fish(cell_count, self.__tables.column_ids, self.__tables.row_ids, technique)
 
-                        # Remove the number from the candidates along the column,
-                        # excluding the cells that make up the Swordfish
-                        self.__remove_candidate_by_iter(
-                            num,
-                            self.__col_cell_coords_iter,
-                            block_coords.block_col,
-                            block_coords.col,
-                            list(chain(*dataset)),
-                            technique,
-                        )
-
-    def __reduce_xwing_sword_jelly_col(self, cell_count):
-        technique = self.__x_sword_jelly_technique(cell_count)
+    def __find_fish(self, cell_count, base_ids, cover_ids, technique):
+        '''
+        Looks for cell_count base lines (rows or columns) where a number only fits in
+        the same cell_count cover lines.  The number must then be in those cells of the
+        cover lines, so it is removed from the rest of the cover lines.
 
-        potential_cells = self.__potential_rectangle_cells(cell_count, self.__column_coords_iter)
+        A number's positions within a row are the columns it fits in, and its positions
+        within a column are the rows it fits in, so combining the lines' position masks
+        gives the cover lines directly.
+        '''
 
         # Iterate through each number
-        for num in potential_cells:
+        for num in mask_nums(candidate_mask(self.__tables.size)):
 
-            # Iterate through all possible cell_count cells
-            for dataset in combinations(potential_cells[num], cell_count):
+            # Keep the lines where the number fits in between 2 and cell_count cells
+            base_lines = []
+            for line, unit in enumerate(base_ids):
+                positions = self.__grid.get_positions(unit, num)
+                if 2 <= bit_count(positions) <= cell_count:
+                    base_lines.append((line, positions))
 
-                # Checks if the current triplet of rows forms a valid Swordfish across 3 rows
-                if self.__valid_rectangle_row_cells(cell_count, *dataset):
+            if len(base_lines) >= cell_count:
+                self.__search_fish(num, cell_count, base_lines, 0, 0, 0, cover_ids, technique)
 
-                    # Iterate through the 3 affected rows
-                    for block_coords in self.__rows_in_common(*dataset):
+    def __search_fish(  # pylint: disable=too-many-arguments
+            self,
+            num,
+            cell_count,
+            base_lines,
+            start,
+            base_mask,
+            cover_mask,
+            cover_ids,
+            technique):
+        '''
+        Adds base lines from start onwards to the fish, skipping any line that would
+        spread the number over more than cell_count cover lines
+        '''
 
-                        # Remove the number from the candidates along the row, excluding the cells
-                        # that make up the Swordfish
-                        self.__remove_candidate_by_iter(
+        # A complete fish, so remove the number from the cover lines outside of the base lines
+        if bit_count(base_mask) == cell_count:
+            if bit_count(cover_mask) == cell_count:
+                for cover_line in mask_indexes(cover_mask):
+                    unit = cover_ids[cover_line]
+                    positions = self.__grid.get_positions(unit, num) & ~base_mask
+                    for position in mask_indexes(positions):
+                        self.__clear_cell_candidate_and_set(
                             num,
-                            self.__row_cell_coords_iter,
-                            block_coords.block_row,
-                            block_coords.row,
-                            list(chain(*dataset)),
+                            self.__tables.units[unit][position].cell_index,
                             technique,
                         )
+            return
 
-    @staticmethod
-    def __valid_rectangle_row_cells(cell_count, *data_list):
-
-        row_data = DictCounter()
-        complete_data_lists = True
-
-        for data in data_list:
-            if not data:
-                complete_data_lists = False
-            for coords in data:
-                row = '%s,%s' % (coords.block_row, coords.row)
-                row_data.add(row)
-
-        return row_data.key_count() == cell_count and row_data.counts_ge(2) and complete_data_lists
-
-    @staticmethod
-    def __valid_rectangle_col_cells(cell_count, *data_list):
-
-        col_data = DictCounter()
-        complete_data_lists = True
-
-        for data in data_list:
-            if not data:
-                complete_data_lists = False
-            for coords in data:
-                col = '%s,%s' % (coords.block_col, coords.col)
-                col_data.add(col)
-
-        return col_data.key_count() == cell_count and col_data.counts_ge(2) and complete_data_lists
-
-    @staticmethod
-    def __rows_in_common(*data_list):
-        row_set = set()
-
-        for data in data_list:
-            for coords in data:
-                row_set.add(SudokuCoordinates(coords.block_row, 0, coords.row, 0))
-
-        return row_set
-
-    @staticmethod
-    def __columns_in_common(*data_list):
-        col_set = set()
-
-        for data in data_list:
-            for coords in data:
-                col_set.add(SudokuCoordinates(0, coords.block_col, 0, coords.col))
-
-        return col_set
-
-    def __potential_rectangle_cells(self, cell_count, coord_iter):
-        '''
-        Search all rows/columns for cells that have between 2 and cell_count candidates
-        cell_count is dependent on the technique.  This method is used in the xwing,
-        swordfish, jellyfish type puzzles
-        '''
-
-        potential_cells = num_dict_list(3)
-
-        # Iterate through each row/cell in the sudoku grid
-        for cell_coordinates_list in coord_iter():
-            hint_coords = num_dict_list(3)
-
-            # Iterate through each cell's coordinates
-            for cell_coords in cell_coordinates_list:
-
-                # Loop through all candidates in the current cell
-                candidates = self.get_cell_candidates(
-                    cell_coords.block_row,
-                    cell_coords.block_col,
-                    cell_coords.row,
-                    cell_coords.col,
+        for i in xrange(start, len(base_lines)):
+            line, positions = base_lines[i]
+            union = cover_mask | positions
+            if bit_count(union) <= cell_count:
+                self.__search_fish(
+                    num,
+                    cell_count,
+                    base_lines,
+                    i + 1,
+                    base_mask | 1 << line,
+                    union,
+                    cover_ids,
+                    technique,
                 )
-                for num in candidates:
-                    # Store the current coordinates
-                    hint_coords[num].append(cell_coords)
-
-            # Keep only the cells that have between 2 and cell_count candidates left in the row/col
-            for num in hint_coords:
-                if 2 <= len(hint_coords[num]) <= cell_count:
-                    potential_cells[num].append(hint_coords[num])
-
-        return potential_cells
 
     @staticmethod
     def __x_sword_jelly_technique(cell_count):
@@ -931,106 +1137,80 @@ class Sudoku(object):
         }
         return techniques[cell_count]
 
-    def __reduce_naked_sets(self):
-        # Reduce naked sets by row
-        self.__find_naked_sets(self.__row_coords_iter)
-
-        # Reduce naked sets by column
-        self.__find_naked_sets(self.__column_coords_iter)
-
-        # Reduce naked sets by block
-        self.__find_naked_sets(self.__block_coords_iter)
+    def __reduce_naked_sets(self, set_size):
+        '''
+        Finds set_size cells of a row, column, or block that only have set_size numbers
+        between them.  Those numbers must go in those cells, so they are removed from the
+        rest of the unit.  set_size determines the naked set size, 2=naked pairs,
+        3=naked trios, 4=naked quads
+        '''
+        technique = self.__naked_set_technique(set_size)
 
-    def __find_naked_sets(self, coord_iter):
+        # Iterate through each row, column, and block in the sudoku grid
+        for unit in self.__tables.unit_ids:
+            cell_coordinates_list = self.__tables.units[unit]
 
-        # Iterate through each row/column/block in the sudoku grid
-        for cell_coordinates_list in coord_iter():
-            candidate_coords = []
+            # Store the candidates of the cells with few enough candidates to be part of
+            # a naked set, along with their positions in the unit
+            position_masks = []
             candidate_list = []
-
-            # Iterate through each cell's coordinates
-            for cell_coords in cell_coordinates_list:
-
-                # Store the cell's coordinates and candidates
-                candidates = self.get_cell_candidates(
-                    cell_coords.block_row,
-                    cell_coords.block_col,
-                    cell_coords.row,
-                    cell_coords.col,
-                )
-                if candidates:
-                    candidate_coords.append(cell_coords)
+            for position, coords in enumerate(cell_coordinates_list):
+                candidates = self.__get_candidates(coords.cell_index)
+                if 2 <= bit_count(candidates) <= set_size:
+                    position_masks.append(1 << position)
                     candidate_list.append(candidates)
 
-            # set_size determines the naked set size, 2=naked pairs, 3=naked trios, 4=naked quads
-            for set_size in xrange(2, 5):
+            for index_list, unique_candidates in self.__find_subsets(candidate_list, set_size):
+                set_positions = self.__combine_candidates(position_masks, index_list)
 
-                # Looks for naked sets in the current set of cells
-                self.__find_naked_set_combinations(
-                    set_size,
-                    candidate_list,
-                    candidate_coords,
-                    cell_coordinates_list,
-                )
+                # Remove the numbers in the naked set from the rest of the unit
+                for num in mask_nums(unique_candidates):
+                    positions = self.__grid.get_positions(unit, num) & ~set_positions
+                    for position in mask_indexes(positions):
+                        self.__clear_cell_candidate_and_set(
+                            num,
+                            cell_coordinates_list[position].cell_index,
+                            technique,
+                        )
 
-    def __find_naked_set_combinations(
-            self,
-            set_size,
-            candidate_list,
-            candidate_coords,
-            cell_coordinates_list):
+    def __find_subsets(self, mask_list, set_size):
         '''
-        Finds all valid naked sets.  If any are found, remove the numbers that are found in the
-        naked sets from all remaining neighboring cells.
+        Yields (index_list, union) for every set_size masks from mask_list whose union has
+        exactly set_size bits.  Subsets are grown one mask at a time and abandoned as soon
+        as their union has more than set_size bits.  Used for both naked sets (masks of
+        candidates) and hidden sets (masks of positions).
         '''
-        technique = self.__naked_set_technique(set_size)
-
-        # Generates a list with all combinations of size set_size.
-        # If candidate_list = [0, 1, 2] and set_size = 2, then 3 index_lists would be created
-        # [0, 1], [0, 2], [1, 2]
-        for index_list in combinations(xrange(len(candidate_list)), set_size):
-
-            # Generate a set of the unique candidates in candidate_list
-            unique_candidates = self.__combine_candidates(candidate_list, index_list)
-
-            # Valid naked sets have been found when the number of unique numbers == the set size.
-            # If 2 unique numbers are found in 2 cells, then you can remove those 2 numbers from
-            # the remaining cells.  Same criteria applies if you find 3 unique numbers in 3 cells,
-            # 4 unique numbers in 4 cells.
-            if len(unique_candidates) == set_size:
-
-                # Store the coordinates of the cells that made up the naked sets.
-                skip_coords_list = []
-                for i in index_list:
-                    skip_coords_list.append(candidate_coords[i])
-
-                # Iterate through each number in the naked set
-                for num in unique_candidates:
-
-                    # Iterate through each cell in the current row/column/block
-                    for coords in cell_coordinates_list:
-
-                        # Skip the cells that are in the skip list
-                        # (cells that made up the naked set)
-                        if not self.__coords_in_list(coords, skip_coords_list):
+        if len(mask_list) >= set_size:
+            for subset in self.__grow_subsets(mask_list, set_size, 0, [], 0):
+                yield subset
 
-                            # Remove the numbers from the cell candidates
-                            self.__clear_cell_candidate_and_set(
-                                num,
-                                coords.block_row,
-                                coords.block_col,
-                                coords.row,
-                                coords.col,
-                                technique,
-                            )
+    def __grow_subsets(  # pylint: disable=too-many-arguments
+            self,
+            mask_list,
+            set_size,
+            start,
+            index_list,
+            union):
+        ''' Adds masks from start onwards to the subset while the union stays small enough '''
+        if len(index_list) == set_size:
+            if bit_count(union) == set_size:
+                yield index_list, union
+            return
+
+        # Stop once there are not enough masks left to fill the subset
+        for i in xrange(start, len(mask_list) - set_size + len(index_list) + 1):
+            grown = union | mask_list[i]
+            if bit_count(grown) <= set_size:
+                for subset in self.__grow_subsets(
+                        mask_list, set_size, i + 1, index_list + [i], grown):
+                    yield subset
 
     @staticmethod
-    def __combine_candidates(set_list, coords):
-        ''' Generate a set of the unique candidates in candidate_list '''
-        unique_candidates = set()
+    def __combine_candidates(mask_list, coords):
+        ''' Generate a bitmask of the unique candidates in candidate_list '''
+        unique_candidates = 0
         for index_num in coords:
-            for num in list(set_list[index_num]):
-                unique_candidates.add(num)
+            unique_candidates |= mask_list[index_num]
         return unique_candidates
 
     @staticmethod
@@ -1043,265 +1223,215 @@ class Sudoku(object):
         }
         return techniques[set_size]
 
-    def __reduce_ywing(self):
-
-        # Iterate through each row in the sudoku grid
-        for cell_coordinates_list in self.__row_coords_iter():
-
-            # Iterate through each cell's coordinates
-            for cell_coords in cell_coordinates_list:
-
-                # Perform Y wing technique
-                self.__find_potential_ywing(cell_coords)
+    def __reduce_hidden_sets(self, set_size):
+        '''
+        Finds numbers that can only go in the same set_size cells of a row, column, or
+        block.  Those cells must hold those numbers, so every other candidate is removed
+        from them.  set_size determines the hidden set size, 2=hidden pairs,
+        3=hidden trios, 4=hidden quads
+        '''
+        technique = self.__hidden_set_technique(set_size)
 
-    def __find_potential_ywing(self, coords):
-        ''' Performs the Y wing technique '''
-        technique = 'Y-Wing'
+        # Iterate through each row, column, and block in the sudoku grid
+        for unit in self.__tables.unit_ids:
+            cell_coordinates_list = self.__tables.units[unit]
 
-        # Look for a pivot cell that has 2 unknown candidates
-        pivot_cell_candidates = self.get_cell_candidates(
-            coords.block_row,
-            coords.block_col,
-            coords.row,
-            coords.col,
-        )
+            # Store the positions of the numbers that fit in few enough cells to be
+            # part of a hidden set.  Numbers with 1 position are left to the singles.
+            num_masks = []
+            positions_list = []
+            for num in mask_nums(self.__find_unassigned_nums(unit)):
+                positions = self.__grid.get_positions(unit, num)
+                if 1 < bit_count(positions) <= set_size:
+                    num_masks.append(num_mask(num))
+                    positions_list.append(positions)
 
-        # Y wing requires the pivot cell to contain exactly 2 candidates
-        if len(pivot_cell_candidates) == 2:
+            for index_list, unique_positions in self.__find_subsets(positions_list, set_size):
 
-            # Get a list of coordinates and candidates seen by the current cell
-            coords_list, candidates_list = self.__valid_cells_seen_by(
-                coords,
-                pivot_cell_candidates,
-                self.__valid_y_cell,
-            )
+                # The numbers only fit in as many cells as there are numbers
+                set_mask = self.__combine_candidates(num_masks, index_list)
 
-            # Iterate through all pairs of cells
-            for index_list in combinations(xrange(len(coords_list)), 2):
+                # Remove every other number from the cells in the hidden set
+                for position in mask_indexes(unique_positions):
+                    index = cell_coordinates_list[position].cell_index
+                    for num in mask_nums(self.__get_candidates(index) & ~set_mask):
+                        self.__clear_cell_candidate_and_set(num, index, technique)
 
-                # Create a set of common of candidate numbers from the pair of cells.
-                # If there is only 1 candidate number and its not found in the pivot cell
-                # then remove that number from the overlapping cells that can see one
-                # another between the current pairs of cells.
-                common_set = candidates_list[index_list[0]].intersection(
-                    candidates_list[index_list[1]],
-                )
-                if len(common_set) == 1:
-                    remove_num = common_set.pop()
-                    if remove_num not in pivot_cell_candidates:
-                        remove_coords = self.__coords_intersection(
-                            coords_list[index_list[0]],
-                            coords_list[index_list[1]],
-                        )
+    @staticmethod
+    def __hidden_set_technique(set_size):
+        ''' Returns the technique name for a given set_size '''
+        techniques = {
+            2: 'Hidden Pairs',
+            3: 'Hidden Trios',
+            4: 'Hidden Quads',
+        }
+        return techniques[set_size]
 
-                        for r_coords in remove_coords:
-                            self.__clear_cell_candidate_and_set(
-                                remove_num,
-                                r_coords.block_row,
-                                r_coords.block_col,
-                                r_coords.row,
-                                r_coords.col,
-                                technique,
-                            )
+    ##
+    # WING TECHNIQUES BELOW
+    # The Y, XYZ, and WXYZ wings share an index of the cells with 2 to 4 candidates
+    # and the other such cells each of them sees.  The index is built the first time
+    # a wing technique needs it and thrown away whenever the puzzle changes.
+    ##
 
-    @staticmethod
-    def __valid_y_cell(pivot_cell_candidates, cell_candidates):
+    def __wing_index(self):
         '''
-        Looks for a cell that has 2 candidate numbers and shares
-        exactly 1 candidate between itself and the pivot cell
+        Returns a list of (index, candidates, peers) for every cell with 2 to 4 candidates,
+        where peers is a list of (index, candidates) of the other such cells it sees
         '''
-        return len(cell_candidates) == 2 and \
-            len(cell_candidates.intersection(pivot_cell_candidates)) == 1
+        if self.__wing_cells is None:
+            wing_candidates = {}
+            for index in xrange(len(self.__tables.cells)):
+                candidates = self.__get_candidates(index)
+                if 2 <= bit_count(candidates) <= 4:
+                    wing_candidates[index] = candidates
 
-    def __reduce_xyz_wing(self):
+            wing_cells = []
+            for index in sorted(wing_candidates):
+                peers = []
+                for coords in self.__tables.peers[index]:
+                    if coords.cell_index in wing_candidates:
+                        peers.append((coords.cell_index, wing_candidates[coords.cell_index]))
+                wing_cells.append((index, wing_candidates[index], peers))
 
-        # Iterate through each row in the sudoku grid
-        for cell_coordinates_list in self.__row_coords_iter():
+            self.__wing_cells = wing_cells  # pylint: disable=attribute-defined-outside-init
 
-            # Iterate through each cell's coordinates
-            for cell_coords in cell_coordinates_list:
-
-                # Perform XYZ wing technique
-                self.__find_potential_xyz_wing(cell_coords)
-
-    def __find_potential_xyz_wing(self, coords):
-        technique = 'XYZ-Wing'
+        return self.__wing_cells
 
-        # Look for a pivot point that has 3 unknown candidates
-        pivot_cell_candidates = self.get_cell_candidates(
-            coords.block_row,
-            coords.block_col,
-            coords.row,
-            coords.col,
-        )
+    def __reduce_ywing(self):
+        '''
+        Looks for a pivot cell with candidates XY that sees a cell with candidates XZ and
+        a cell with candidates YZ.  Whichever value the pivot takes, one of the two cells
+        must be Z, so Z is removed from every cell that sees both of them.
+        '''
+        technique = 'Y-Wing'
 
-        # XYZ wing requires the pivot cell to contain exactly 3 candidates
-        if len(pivot_cell_candidates) == 3:
+        for pivot, pivot_candidates, peers in self.__wing_index():
 
-            # Get a list of coordinates and candidates seen by the current cell
-            coords_list, candidates_list = self.__valid_cells_seen_by(
-                coords,
-                pivot_cell_candidates,
-                self.__valid_xyz_cell,
-            )
+            # Y wing requires the pivot cell to contain exactly 2 candidates
+            if bit_count(pivot_candidates) != 2:
+                continue
 
-            # Iterate through all pairs of cells
-            for index_list in combinations(xrange(len(coords_list)), 2):
+            # Cells with 2 candidates that share exactly 1 candidate with the pivot
+            wings = [
+                (index, candidates) for index, candidates in peers
+                if bit_count(candidates) == 2 and bit_count(candidates & pivot_candidates) == 1
+            ]
 
-                # Union between each pair
-                candidates_union = self.__candidates_union(
-                    candidates_list[index_list[0]],
-                    candidates_list[index_list[1]],
-                )
+            # Iterate through all pairs of cells.  If they have only 1 candidate in common
+            # and it is not found in the pivot cell, then remove that number from the
+            # cells that see both of them.
+            for (index1, candidates1), (index2, candidates2) in combinations(wings, 2):
+                common_set = candidates1 & candidates2
+                if bit_count(common_set) == 1 and not common_set & pivot_candidates:
+                    self.__remove_from_cells_seeing_all(common_set, [index1, index2], technique)
 
-                if len(candidates_union) == 3:
-                    common_set = self.__candidates_intersection(
-                        candidates_list[index_list[0]],
-                        candidates_list[index_list[1]],
-                    )
-                    remove_num = common_set.pop()
+    def __reduce_xyz_wing(self):
+        '''
+        Looks for a pivot cell with candidates XYZ that sees a cell with candidates XZ and
+        a cell with candidates YZ.  One of the three cells must be Z, so Z is removed from
+        every cell that sees all three.
+        '''
+        technique = 'XYZ-Wing'
 
-                    remove_coords = self.__coords_intersection(
-                        coords,
-                        coords_list[index_list[0]],
-                        coords_list[index_list[1]],
+        for pivot, pivot_candidates, peers in self.__wing_index():
+
+            # XYZ wing requires the pivot cell to contain exactly 3 candidates
+            if bit_count(pivot_candidates) != 3:
+                continue
+
+            # Cells with 2 candidates that are all found within the pivot cell
+            wings = [
+                (index, candidates) for index, candidates in peers
+                if bit_count(candidates) == 2 and not candidates & ~pivot_candidates
+            ]
+
+            # Iterate through all pairs of cells that cover the pivot's candidates
+            for (index1, candidates1), (index2, candidates2) in combinations(wings, 2):
+                if bit_count(candidates1 | candidates2) == 3:
+                    self.__remove_from_cells_seeing_all(
+                        candidates1 & candidates2,
+                        [pivot, index1, index2],
+                        technique,
                     )
 
-                    for r_coords in remove_coords:
-                        self.__clear_cell_candidate_and_set(
-                            remove_num,
-                            r_coords.block_row,
-                            r_coords.block_col,
-                            r_coords.row,
-                            r_coords.col,
-                            technique,
-                        )
-
-    @staticmethod
-    def __valid_xyz_cell(pivot_cell_candidates, cell_candidates):
+    def __reduce_wxyz_wing(self):
         '''
-        Look for cells that have 2 unknown candidates that are all found
-        within the pivot cell
+        Looks for a pivot cell and 3 cells it sees that hold 4 numbers between them, where
+        only 1 of the numbers is shared by cells that can not see each other.  That number
+        must be in one of the cells holding it, so it is removed from every cell that sees
+        all of them.
         '''
-        return len(cell_candidates) == 2 and cell_candidates.issubset(pivot_cell_candidates)
-
-    def __reduce_wxyz_wing(self):
-
-        # Iterate through each row in the sudoku grid
-        for cell_coordinates_list in self.__row_coords_iter():
-
-            # Iterate through each cell's coordinates
-            for cell_coords in cell_coordinates_list:
-
-                # Perform WXYZ wing technique
-                self.__find_potential_wxyz_wing(cell_coords)
-
-    def __find_potential_wxyz_wing(self, coords):
         technique = 'WXYZ-Wing'
 
-        pivot_cell_candidates = self.get_cell_candidates(
-            coords.block_row,
-            coords.block_col,
-            coords.row,
-            coords.col,
-        )
-
-        # Get a list of coordinates and candidates seen by the current cell
-        coords_list, candidates_list = self.__valid_cells_seen_by(
-            coords,
-            pivot_cell_candidates,
-            self.__valid_wxyz_cell,
-        )
-
-        # Iterate through all pairs of cells
-        for index_list in combinations(xrange(len(coords_list)), 3):
+        for pivot, pivot_candidates, peers in self.__wing_index():
 
-            candidates_union = self.__candidates_union(
-                pivot_cell_candidates,
-                candidates_list[index_list[0]],
-                candidates_list[index_list[1]],
-                candidates_list[index_list[2]],
-            )
+            # Cells that have at least 1 number in common with the pivot cell
+            wings = [
+                (index, candidates) for index, candidates in peers
+                if candidates & pivot_candidates
+            ]
 
-            if len(candidates_union) == 4:
-                remove_num = self.__find_non_restricted_candidate(
-                    [
-                        candidates_list[index_list[0]],
-                        candidates_list[index_list[1]],
-                        candidates_list[index_list[2]],
-                    ],
-                    [
-                        coords_list[index_list[0]],
-                        coords_list[index_list[1]],
-                        coords_list[index_list[2]],
-                    ],
-                )
+            # Iterate through all triplets of cells
+            for wing_list in combinations(wings, 3):
+                candidates_union = pivot_candidates
+                for _, candidates in wing_list:
+                    candidates_union |= candidates
 
-                if remove_num is not None:
+                if bit_count(candidates_union) != 4:
+                    continue
 
-                    coords_for_intersection = []
-                    if remove_num in pivot_cell_candidates:
-                        coords_for_intersection.append(coords)
-                    for i in xrange(3):
-                        if remove_num in candidates_list[index_list[i]]:
-                            coords_for_intersection.append(coords_list[index_list[i]])
+                remove_set = self.__find_non_restricted_candidate(wing_list)
+                if remove_set:
+                    cell_list = [
+                        index for index, candidates in ((pivot, pivot_candidates),) + wing_list
+                        if candidates & remove_set
+                    ]
+                    self.__remove_from_cells_seeing_all(remove_set, cell_list, technique)
 
-                    remove_coords = self.__coords_intersection(*coords_for_intersection)
-
-                    for r_coords in remove_coords:
-                        self.__clear_cell_candidate_and_set(
-                            remove_num,
-                            r_coords.block_row,
-                            r_coords.block_col,
-                            r_coords.row,
-                            r_coords.col,
-                            technique,
-                        )
-
-    @staticmethod
-    def __find_non_restricted_candidate(candidates_list, coords_list):
-        candidate_set = set()
+    def __find_non_restricted_candidate(self, wing_list):
+        '''
+        Returns the bitmask of the number shared by cells that can not see each other,
+        or 0 if there is not exactly 1 such number
+        '''
+        candidate_set = 0
 
         # Iterate through each pair of cells
-        for index_list in combinations(xrange(len(coords_list)), 2):
+        for (index1, candidates1), (index2, candidates2) in combinations(wing_list, 2):
 
-            # Look for cells that can't see each other
-            if not coords_list[index_list[0]].aligns_by_row(coords_list[index_list[1]]) and \
-                    not coords_list[index_list[0]].aligns_by_col(coords_list[index_list[1]]) and \
-                    not coords_list[index_list[0]].aligns_by_block(coords_list[index_list[1]]):
+            # Look for the numbers shared in common between cells that can't see each other
+            if self.__tables.cells[index2] not in self.__tables.peers[index1]:
+                candidate_set |= candidates1 & candidates2
 
-                # Look for the numbers shared in common between both cells
-                intersection_set = candidates_list[index_list[0]].intersection(
-                    candidates_list[index_list[1]]
-                )
-                candidate_set = candidate_set.union(intersection_set)
+        return candidate_set if bit_count(candidate_set) == 1 else 0
 
-        if len(candidate_set) == 1:
-            return candidate_set.pop()
-        else:
-            return None
+    def __remove_from_cells_seeing_all(self, remove_set, cell_list, technique):
+        ''' Removes the number in remove_set from every cell that sees all the cells '''
+        remove_num = next(mask_nums(remove_set))
+        remove_coords = self.__coords_intersection(
+            *[self.__tables.cells[index] for index in cell_list]
+        )
 
-    @staticmethod
-    def __valid_wxyz_cell(pivot_cell_candidates, cell_candidates):
-        ''' Look for cells that have candidates and at least 1 number in common '''
-        return len(cell_candidates) >= 2 and \
-            len(cell_candidates.intersection(pivot_cell_candidates)) >= 1
+        for r_coords in remove_coords:
+            self.__clear_cell_candidate_and_set(remove_num, r_coords.cell_index, technique)
 
     def __reduce_multiple_lines(self):
         technique = 'Multiple Lines'
+        size = self.__tables.size
+
         # Iterate through each block
-        for cell_coordinates_list in self.__block_coords_iter():
+        for unit in self.__tables.block_ids:
 
             # Extract the current block coordinates
-            block_row = cell_coordinates_list[0].block_row
-            block_col = cell_coordinates_list[0].block_col
+            block_row = self.__tables.units[unit][0].block_row
+            block_col = self.__tables.units[unit][0].block_col
 
             # Generate list of numbers that can still be assigned to the
             # remaining cells in the row or column
-            unassigned_nums = self.__find_unassigned_nums(cell_coordinates_list)
+            unassigned_nums = self.__find_unassigned_nums(unit)
 
             # Look for rows/columns that share the unassigned number in pairs of rows
-            for num in unassigned_nums:
+            for num in mask_nums(unassigned_nums):
 
                 # Identify the rows in the current block that can
                 # have the number eliminated from the candidates
@@ -1310,13 +1440,10 @@ class Sudoku(object):
 
                     # Remove the number from the cell's candidates
                     for row in shared_rows:
-                        for col in xrange(3):
+                        for col in xrange(size):
                             self.__clear_cell_candidate_and_set(
                                 num,
-                                block_row,
-                                block_col,
-                                row,
-                                col,
+                                cell_index(block_row, block_col, row, col, size),
                                 technique,
                             )
 
@@ -1327,13 +1454,10 @@ class Sudoku(object):
 
                     # Remove the number from the cell's candidates
                     for col in shared_cols:
-                        for row in xrange(3):
+                        for row in xrange(size):
                             self.__clear_cell_candidate_and_set(
                                 num,
-                                block_row,
-                                block_col,
-                                row,
-                                col,
+                                cell_index(block_row, block_col, row, col, size),
                                 technique,
                             )
 
@@ -1342,25 +1466,29 @@ class Sudoku(object):
         Identify the rows in the current block that can
         have the number eliminated from the candidates
         '''
+        size = self.__tables.size
         shared_rows = set()
         affected_blocks = set()
 
         # Iterate through the remaining columns except for the starting one
-        for block_col_loop in [x for x in xrange(3) if x != block_col]:
+        for block_col_loop in [x for x in xrange(size) if x != block_col]:
 
-            # Iterate through each cell in the block
-            for row, col in double_iter(3):
+            # Look up the positions in the block where num can be placed
+            positions = self.__grid.get_positions(
+                self.__tables.block_ids[block_row * size + block_col_loop],
+                num,
+            )
 
-                # Check the cell's candidates if num can be placed here.
-                # If it can, track the row and block
-                candidates = self.get_cell_candidates(block_row, block_col_loop, row, col)
-                if num in candidates:
+            # Iterate through each row in the block.
+            # If num can be placed in it, track the row and block
+            for row, row_mask in enumerate(self.__tables.block_row_masks):
+                if positions & row_mask:
                     shared_rows.add(row)
                     affected_blocks.add(block_col_loop)
 
         # Criteria for the multiple lines technique is that there are 2 shared rows
-        # across 2 blocks with the same number.
-        if len(shared_rows) == 2 and len(affected_blocks) == 2:
+        # across 2 blocks with the same number (1 less than the block size in general).
+        if len(shared_rows) == size - 1 and len(affected_blocks) == size - 1:
             return shared_rows
         else:
             return set()
@@ -1370,29 +1498,160 @@ class Sudoku(object):
         Identify the columns in the current block that can
         have the number eliminated from the candidates
         '''
+        size = self.__tables.size
         shared_cols = set()
         affected_blocks = set()
 
         # Iterate through the remaining rows except for the starting one
-        for block_row_loop in [x for x in xrange(3) if x != block_row]:
+        for block_row_loop in [x for x in xrange(size) if x != block_row]:
 
-            # Iterate through each cell in the block
-            for row, col in double_iter(3):
+            # Look up the positions in the block where num can be placed
+            positions = self.__grid.get_positions(
+                self.__tables.block_ids[block_row_loop * size + block_col],
+                num,
+            )
 
-                # Check the cell's candidates if num can be placed here.
-                # If it can, track the column and block
-                candidates = self.get_cell_candidates(block_row_loop, block_col, row, col)
-                if num in candidates:
+            # Iterate through each column in the block.
+            # If num can be placed in it, track the column and block
+            for col, col_mask in enumerate(self.__tables.block_col_masks):
+                if positions & col_mask:
                     shared_cols.add(col)
                     affected_blocks.add(block_row_loop)
 
         # Criteria for the multiple lines technique is that there are 2 shared columns
-        # across 2 blocks with the same number.
-        if len(shared_cols) == 2 and len(affected_blocks) == 2:
+        # across 2 blocks with the same number (1 less than the block size in general).
+        if len(shared_cols) == size - 1 and len(affected_blocks) == size - 1:
             return shared_cols
         else:
             return set()
 
+    ##
+    # CHAIN TECHNIQUES BELOW
+    # A candidate is a (cell index, number) node.  Two nodes are strongly linked when
+    # one of them must be true, which happens when they are the only 2 candidates of a
+    # cell or the only 2 positions of a number within a unit.  Two nodes are weakly
+    # linked when they can not both be true, which happens when they share a cell or
+    # are the same number within a unit.  The links are read straight from the
+    # candidates and the unit index, which are kept up to date as candidates change.
+    ##
+
+    def __reduce_chains(self, technique, cell_strong_links, unit_strong_links, cell_weak_links):
+        '''
+        Looks for chains that alternate between strong and weak links, starting and ending
+        with a strong link.  If the first node of such a chain is false then the last one
+        is true, so any candidate that can not be true alongside either of them is removed.
+
+        X-Cycles only link a number to itself within units, XY-Chains only use strong links
+        within cells, and Alternating Inference Chains use every link.
+
+        Stops at the first chain that removes candidates, so the cheaper techniques get
+        another go before searching for more chains.
+        '''
+        link_types = (cell_strong_links, unit_strong_links, cell_weak_links)
+
+        for index in xrange(len(self.__tables.cells)):
+            for num in mask_nums(self.__get_candidates(index)):
+                if self.__find_chains((index, num), technique, link_types):
+                    return
+
+    def __find_chains(self, start, technique, link_types):
+        '''
+        Follows every chain from start breadth first, assuming start is false.  Nodes at
+        the end of a strong link are then true, and nodes at the end of a weak link from
+        a true node are false.  Returns True once a chain has removed candidates.
+        '''
+        cell_strong_links, unit_strong_links, cell_weak_links = link_types
+
+        false_nodes = [start]
+        seen_false = set(false_nodes)
+        seen_true = set()
+
+        while false_nodes:
+            true_nodes = []
+            for node in false_nodes:
+                for linked in self.__strong_links(node, cell_strong_links, unit_strong_links):
+                    if linked not in seen_true:
+                        seen_true.add(linked)
+                        true_nodes.append(linked)
+
+                        # Either start or linked is true
+                        self.__remove_chain_candidates(start, linked, technique)
+                        if self.__puzzle_changed():
+                            return True
+
+            false_nodes = []
+            for node in true_nodes:
+                for linked in self.__weak_links(node, cell_weak_links):
+                    if linked not in seen_false:
+                        seen_false.add(linked)
+                        false_nodes.append(linked)
+
+        return False
+
+    def __strong_links(self, node, cell_links, unit_links):
+        ''' Returns the nodes that must be true when node is false '''
+        index, num = node
+        links = []
+
+        # The other candidate of a cell with 2 candidates
+        if cell_links:
+            candidates = self.__get_candidates(index)
+            if bit_count(candidates) == 2:
+                links.append((index, (candidates & ~num_mask(num)).bit_length()))
+
+        # The other position of a number with 2 positions left in a unit
+        if unit_links:
+            for unit, position in self.__tables.cell_unit_positions[index]:
+                positions = self.__grid.get_positions(unit, num)
+                if bit_count(positions) == 2:
+                    other = (positions & ~(1 << position)).bit_length() - 1
+                    links.append((self.__tables.units[unit][other].cell_index, num))
+
+        return links
+
+    def __weak_links(self, node, cell_links):
+        ''' Returns the nodes that must be false when node is true '''
+        index, num = node
+        links = []
+
+        # The other candidates of the cell
+        if cell_links:
+            for other_num in mask_nums(self.__get_candidates(index) & ~num_mask(num)):
+                links.append((index, other_num))
+
+        # The other positions of the number within the cell's row, column, and block
+        for unit, position in self.__tables.cell_unit_positions[index]:
+            cell_coordinates_list = self.__tables.units[unit]
+            for other in mask_indexes(self.__grid.get_positions(unit, num) & ~(1 << position)):
+                links.append((cell_coordinates_list[other].cell_index, num))
+
+        return links
+
+    def __remove_chain_candidates(self, start, end, technique):
+        ''' Removes the candidates that can not be true alongside either start or end '''
+        (index1, num1), (index2, num2) = start, end
+
+        # Start being false leads to start being true, so it must be true
+        if start == end:
+            self.__set_value(num1, index1, technique)
+
+        # Both nodes are in the same cell, so the cell can only be one of them
+        elif index1 == index2:
+            for num in mask_nums(self.__get_candidates(index1) & ~num_mask(num1) & ~num_mask(num2)):
+                self.__clear_cell_candidate_and_set(num, index1, technique)
+
+        # The number is in one of the cells, so it is removed from the cells that see both
+        elif num1 == num2:
+            cells = self.__tables.cells
+            for coords in self.__coords_intersection(cells[index1], cells[index2]):
+                self.__clear_cell_candidate_and_set(num1, coords.cell_index, technique)
+
+        # Different numbers in cells that see each other, so each cell can not be the
+        # other cell's number
+        elif self.__tables.cells[index2] in self.__tables.peers[index1]:
+            self.__clear_cell_candidate_and_set(num2, index1, technique)
+            self.__clear_cell_candidate_and_set(num1, index2, technique)
+
     def __check_valid(self):
         # Check valid cells by row
         self.__check_valid_cells(self.__row_coords_iter, 'Rows')
@@ -1408,7 +1667,7 @@ class Sudoku(object):
         self.__set_solved_true()
 
     def __check_valid_cells(self, coord_iter, iter_type):
-        ''' Makes sure there are 9 unique elements in the iterator '''
+        ''' Makes sure every number of the grid appears once in each unit of the iterator '''
 
         # Iterate through each row/column/block in the sudoku grid
         for cell_coordinates_list in coord_iter():
@@ -1416,15 +1675,10 @@ class Sudoku(object):
 
             # Iterate through each cell's coordinates
             for cell_coords in cell_coordinates_list:
-                num = self.get_cell_value(
-                    cell_coords.block_row,
-                    cell_coords.block_col,
-                    cell_coords.row,
-                    cell_coords.col,
-                )
+                num = self.__get_value(cell_coords.cell_index)
                 valid_nums.add(num)
 
-            if len(valid_nums) != 9:
+            if len(valid_nums) != self.__tables.size**2:
                 raise Exception(
                     'Completed puzzle is not a valid solution.  %s contain duplicate entries.  '
                     'Check the starting puzzle or code to remove bugs.' % (iter_type)
@@ -1437,9 +1691,10 @@ class Sudoku(object):
     # Private Iterator Methods
     # The following iterators are helpful for traversing the sudoku
     # grid's cells.  They yield the coordinates for the cells that
-    # make up each of the grid's rows, columns, or blocks.
+    # make up each of the grid's rows, columns, or blocks.  The units
+    # are read from the precomputed SudokuTables, so nothing is allocated.
 
-    # Iterator that yields lists, which contain the coordinates for every cell
+    # Iterator that yields tuples, which contain the coordinates for every cell
     # that corresponds to a row in the sudoku grid.
     # For instance, for the following example grid:
     #
@@ -1447,27 +1702,21 @@ class Sudoku(object):
     # 456
     # 789
     #
-    # The iterator would yield the following 3 lists, where the contents of each
-    # list are coordinate objects for each cell.
+    # The iterator would yield the following 3 tuples, where the contents of each
+    # tuple are coordinate objects for each cell.
     # [1, 2, 3], [4, 5, 6], [7, 8, 9]
     ##
     def __row_coords_iter(self):
-        for block_row, row in double_iter(3):
-            row_coords = []
-            for coords in self.__row_cell_coords_iter(block_row, row):
-                row_coords.append(coords)
-            yield row_coords
+        return iter(self.__tables.rows)
 
-    @staticmethod
-    def __row_cell_coords_iter(block_row, row):
+    def __row_cell_coords_iter(self, block_row, row):
         '''
         Iterator that yields coordinate objects found in the row specified with block_row, row
         '''
-        for block_col, col in double_iter(3):
-            yield SudokuCoordinates(block_row, block_col, row, col)
+        return iter(self.__tables.rows[block_row * self.__tables.size + row])
 
     ##
-    # Iterator that yields lists, which contain the coordinates for every cell
+    # Iterator that yields tuples, which contain the coordinates for every cell
     # that corresponds to a column in the sudoku grid.
     # For instance, for the following example grid:
     #
@@ -1475,28 +1724,22 @@ class Sudoku(object):
     # 456
     # 789
     #
-    # The iterator would yield the following 3 lists, where the contents of each
-    # list are coordinate objects for each cell.
+    # The iterator would yield the following 3 tuples, where the contents of each
+    # tuple are coordinate objects for each cell.
     # [1, 4, 7], [2, 5, 8], [3, 6, 9]
     ##
     def __column_coords_iter(self):
-        for block_col, col in double_iter(3):
-            col_coords = []
-            for coords in self.__col_cell_coords_iter(block_col, col):
-                col_coords.append(coords)
-            yield col_coords
+        return iter(self.__tables.columns)
 
-    @staticmethod
-    def __col_cell_coords_iter(block_col, col):
+    def __col_cell_coords_iter(self, block_col, col):
         '''
         Iterator that yields coordinate objects found
         in the column specified with block_col, col
         '''
-        for block_row, row in double_iter(3):
-            yield SudokuCoordinates(block_row, block_col, row, col)
+        return iter(self.__tables.columns[block_col * self.__tables.size + col])
 
     ##
-    # Iterator that yields lists, which contain the coordinates for every cell
+    # Iterator that yields tuples, which contain the coordinates for every cell
     # that corresponds to a block in the sudoku grid.
     # For instance, for the following example grid:
     #
@@ -1506,72 +1749,23 @@ class Sudoku(object):
     # 90 *@
     # $% ^&
     #
-    # The iterator would yield the following 4 lists, where the contents of each
-    # list are coordinate objects for each cell.
+    # The iterator would yield the following 4 tuples, where the contents of each
+    # tuple are coordinate objects for each cell.
     # [1, 2, 5, 6], [3, 4, 7, 8], [9, 0, $, %], [*, @, ^, &]
     ##
     def __block_coords_iter(self):
-        for block_row, block_col in double_iter(3):
-            block_coords = []
-            for coords in self.__block_cell_coords_iter(block_row, block_col):
-                block_coords.append(coords)
-            yield block_coords
-
-    @staticmethod
-    def __block_cell_coords_iter(block_row, block_col):
-        '''
-        Iterator that yields coordinate objects found in
-        the block specified with block_row, block_col
-        '''
-        for row, col in double_iter(3):
-            yield SudokuCoordinates(block_row, block_col, row, col)
-
+        return iter(self.__tables.blocks)
 
-class DictCounter(object):
-    ''' Special counter for dictionary elements '''
 
-    def __init__(self):
-        self.__counts = {}
-
-    def counts_ge(self, size):
-        '''
-        Determines if all keys in the dictionary are greater than or equal to size
-
-        :param size:  Integer
-
-        :return:  Boolean
-        '''
-        status = True
-        for key in self.__counts:
-            if self.__counts[key] < size:
-                status = False
-                break
-        return status
-
-    def add(self, key):
-        '''
-        Increases the counter for key by 1
-
-        :param key:  String - A dictionary key
-
-        :return:  None
-        '''
-        try:
-            self.__counts[key] += 1
-        except KeyError:
-            self.__counts[key] = 1
-
-    def key_count(self):
-        '''
-        Returns the total number of keys in the dictionary
+class MissingArguments(Exception):
+    '''.'''
+    pass
 
-        :param:  None
 
-        :return:  Integer - The number of elements in the dictionary
-        '''
-        return len(self.__counts)
+class Contradiction(Exception):
+    ''' Raised when the puzzle reaches a state that can not lead to a valid solution '''
+    pass
 
 
-class MissingArguments(Exception):
-    '''.'''
-    pass
+# Result yielded by Sudoku.solve_many for each puzzle, with the time taken in seconds
+SolveResult = namedtuple('SolveResult', ['solution', 'status', 'techniques_used', 'seconds'])
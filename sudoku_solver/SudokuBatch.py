@@ -0,0 +1,95 @@
+'''.'''
+
+import threading
+import multiprocessing
+from itertools import islice, count
+
+from sudoku_solver.Sudoku import Sudoku
+
+# Number of puzzles sent to a worker process at a time
+DEFAULT_CHUNK_SIZE = 100
+
+# Chunks sent out per worker process before their results have been read back
+CHUNKS_PER_JOB = 4
+
+
+def solve_batch(grids, jobs=1, chunk_size=DEFAULT_CHUNK_SIZE, ordered=True, box_size=3,
+                **solve_kwargs):
+    '''
+    Solves a stream of puzzles with a pool of worker processes.  Puzzles are sent to
+    the workers in chunks, each of which is solved by one reused Sudoku object, and
+    only a few chunks per worker are read ahead of the results, so the stream is
+    never held in memory all at once.
+
+    :param grids:  Iterable of Lists of Lists - Starting values of each puzzle, in the
+                   same format as the data argument of Sudoku
+    :param jobs:  Integer - Number of worker processes, None for one per CPU.  With 1
+                  the puzzles are solved in this process.
+    :param chunk_size:  Integer - Number of puzzles sent to a worker at a time
+    :param ordered:  Boolean - Yield results in the order of the puzzles, otherwise
+                     in the order chunks are finished
+    :param box_size:  Integer - Number of rows and columns in a block
+    :param solve_kwargs:  Optional techniques, order, search, and engine arguments
+                          passed to Sudoku.solve()
+
+    :yield:  Tuple of (Integer, SolveResult) - Position of the puzzle in grids and its result
+    '''
+    if jobs == 1:
+        for index, result in enumerate(Sudoku.solve_many(grids, box_size, **solve_kwargs)):
+            yield index, result
+        return
+
+    if chunk_size < 1:
+        raise ValueError('Invalid chunk size: %s' % (chunk_size))
+
+    pool = multiprocessing.Pool(jobs)
+
+    # Chunks are only read once a slot frees up, which happens whenever the results
+    # of a chunk are yielded.  The pool reads chunks from its own thread.
+    slots = threading.Semaphore(CHUNKS_PER_JOB * (jobs or multiprocessing.cpu_count()))
+    stopped = threading.Event()
+
+    def read_chunks():
+        ''' Yields the next chunk of puzzles whenever a slot is free '''
+        grid_iter = iter(grids)
+        for start in count(0, chunk_size):
+            chunk = list(islice(grid_iter, chunk_size))
+            if not chunk:
+                break
+
+            slots.acquire()
+            if stopped.is_set():
+                break
+            yield start, chunk, box_size, solve_kwargs
+
+    if ordered:
+        chunk_results = pool.imap(solve_chunk, read_chunks())
+    else:
+        chunk_results = pool.imap_unordered(solve_chunk, read_chunks())
+
+    try:
+        for start, results in chunk_results:
+            slots.release()
+            for offset, result in enumerate(results):
+                yield start + offset, result
+        pool.close()
+    finally:
+        # Wakes up the reading thread in case the results stopped being read early
+        stopped.set()
+        slots.release()
+        pool.terminate()
+        pool.join()
+
+
+def solve_chunk(chunk):
+    '''
+    Solves a chunk of puzzles inside a worker process
+
+    :param chunk:  Tuple of (Integer, List, Integer, Dictionary) - Position of the first
+                   puzzle, the puzzles, box size, and arguments passed to Sudoku.solve()
+
+    :return:  Tuple of (Integer, List of SolveResults) - Position of the first puzzle
+              and its results
+    '''
+    start, grids, box_size, solve_kwargs = chunk
+    return start, list(Sudoku.solve_many(grids, box_size, **solve_kwargs))
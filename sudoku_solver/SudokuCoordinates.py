@@ -1,18 +1,44 @@
 '''.'''
 
+from sudoku_solver.utilities import cell_index
 
-class SudokuCoordinates(object):
-    ''' Simple class wrapper to make coordinate retrieval easier '''
 
-    def __init__(self, block_row, block_col, row, col):
-        self.block_row = block_row
-        self.block_col = block_col
-        self.row = row
-        self.col = col
+class SudokuCoordinates(object):
+    '''
+    Simple class wrapper to make coordinate retrieval easier.
+
+    Instances are interned, so creating the same coordinates twice returns the same
+    object.  This allows equality to be tested by identity and the hash to be
+    computed once, which keeps sets of coordinates cheap.
+    '''
+
+    __slots__ = ('block_row', 'block_col', 'row', 'col', 'size', 'cell_index')
+
+    __instances = {}
+
+    def __new__(cls, block_row, block_col, row, col, size=3):  # pylint: disable=too-many-arguments
+        key = (block_row, block_col, row, col, size)
+        try:
+            return cls.__instances[key]
+        except KeyError:
+            coords = super(SudokuCoordinates, cls).__new__(cls)
+            coords.block_row = block_row
+            coords.block_col = block_col
+            coords.row = row
+            coords.col = col
+            coords.size = size
+            # Position of the cell in a flat grid, also used as the hash
+            coords.cell_index = cell_index(block_row, block_col, row, col, size)
+            cls.__instances[key] = coords
+            return coords
+
+    def __reduce__(self):
+        ''' Unpickled coordinates go through __new__ so they stay interned '''
+        return (self.__class__, (self.block_row, self.block_col, self.row, self.col, self.size))
 
     def __hash__(self):
         ''' Allows for storing object in a set([]) and using a sets' methods correctly '''
-        return hash((self.block_row, self.block_col, self.row, self.col))
+        return self.cell_index
 
     def __str__(self):
         ''' Allows for using str(obj) '''
@@ -20,13 +46,11 @@ class SudokuCoordinates(object):
 
     def __eq__(self, other):
         ''' Allows for testing obj1 == obj2 '''
-        return isinstance(other, self.__class__) and \
-            self.aligns_by_row(other) and \
-            self.aligns_by_col(other)
+        return self is other
 
     def __ne__(self, other):
         ''' Allows for testing obj1 != obj2 '''
-        return not self.__eq__(other)
+        return self is not other
 
     ##################
     # Public Methosd #
@@ -0,0 +1,257 @@
+'''.'''
+
+import io
+import os
+import gzip
+import mmap
+import struct
+
+# First bytes of every gzip file
+GZIP_MAGIC = '\x1f\x8b'
+
+# Offsets in an index file are stored as little endian unsigned 64 bit integers
+OFFSET_FORMAT = '<Q'
+OFFSET_SIZE = struct.calcsize(OFFSET_FORMAT)
+
+
+class SudokuCorpus(object):
+    '''
+    Random access to a file with one puzzle per line.  The file is memory mapped, so a
+    puzzle is only read from disk and turned into a string when it is requested.
+
+    The position of every puzzle line is stored in a sidecar index file, by default
+    the corpus name followed by '.idx'.  The index starts with the size of the corpus
+    it was built for, followed by the offset of every puzzle, and is rebuilt whenever
+    it is missing or the corpus has changed.  The index is memory mapped as well, so
+    opening a corpus takes the same time no matter how many puzzles it holds.
+
+    Puzzles can be read by position, sliced, or split into contiguous shards so that
+    workers can each read their own part of the corpus without coordinating.
+    Compressed corpora can not be memory mapped, use read_puzzles() for those.
+    '''
+
+    def __init__(self, file_name, box_size=3, index_file=None):
+        self.__file_name = file_name
+        self.__box_size = box_size
+        self.__index_file = index_file or file_name + '.idx'
+        self.__index = ''
+
+        self.__data = self.__map_file(file_name)
+        if self.__data[:len(GZIP_MAGIC)] == GZIP_MAGIC:
+            self.close()
+            raise ValueError('Compressed corpus can not be memory mapped: %s' % (file_name))
+
+        if not self.__index_current():
+            self.__build_index()
+        self.__index = self.__map_file(self.__index_file)
+        self.__count = len(self.__index) // OFFSET_SIZE - 1
+
+    ########################
+    # Overloaded Operators #
+    ########################
+
+    def __len__(self):
+        return self.__count
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self.__read_puzzle(position) for position in xrange(*key.indices(self.__count))]
+
+        if key < 0:
+            key += self.__count
+        if not 0 <= key < self.__count:
+            raise IndexError('Puzzle index out of range: %s' % (key))
+        return self.__read_puzzle(key)
+
+    def __iter__(self):
+        return self.puzzles(0, self.__count)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    ##################
+    # Public Methods #
+    ##################
+
+    def puzzles(self, start, stop):
+        '''
+        Yields the puzzles from position start up to, but not including, stop
+
+        :param start:  Integer
+        :param stop:  Integer
+
+        :yield:  List of Strings - Rows of the puzzle, which can be passed to Sudoku as data
+        '''
+        for position in xrange(max(start, 0), min(stop, self.__count)):
+            yield self.__read_puzzle(position)
+
+    def shard_bounds(self, shard_id, shard_count):
+        '''
+        Returns the positions of the puzzles in one of shard_count contiguous shards of
+        nearly equal size.  Together the shards hold every puzzle exactly once.
+
+        :param shard_id:  Integer - Shard from 0 to shard_count - 1
+        :param shard_count:  Integer
+
+        :return:  Tuple of Integers - Position of the first puzzle in the shard, and the
+                  position after its last puzzle
+        '''
+        if not 0 <= shard_id < shard_count:
+            raise ValueError('Invalid shard %s of %s' % (shard_id, shard_count))
+
+        return (
+            self.__count * shard_id // shard_count,
+            self.__count * (shard_id + 1) // shard_count,
+        )
+
+    def shard(self, shard_id, shard_count):
+        '''
+        Yields the puzzles in one of shard_count contiguous shards, see shard_bounds()
+
+        :param shard_id:  Integer - Shard from 0 to shard_count - 1
+        :param shard_count:  Integer
+
+        :yield:  List of Strings - Rows of the puzzle, which can be passed to Sudoku as data
+        '''
+        return self.puzzles(*self.shard_bounds(shard_id, shard_count))
+
+    def close(self):
+        '''
+        Releases the memory maps of the corpus and its index
+
+        :param:  None
+
+        :return:  None
+        '''
+        for data in (self.__data, self.__index):
+            if isinstance(data, mmap.mmap):
+                data.close()
+
+    ###################
+    # Private Methods #
+    ###################
+
+    @staticmethod
+    def __map_file(file_name):
+        ''' Memory maps a file for reading.  Empty files can not be mapped. '''
+        with open(file_name, 'rb') as fh_in:
+            if not os.fstat(fh_in.fileno()).st_size:
+                return ''
+            return mmap.mmap(fh_in.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __index_current(self):
+        ''' Checks if the index exists and was built for the corpus as it is now '''
+        try:
+            if os.path.getmtime(self.__index_file) < os.path.getmtime(self.__file_name):
+                return False
+            with open(self.__index_file, 'rb') as fh_in:
+                header = fh_in.read(OFFSET_SIZE)
+        except (IOError, OSError):
+            return False
+
+        return (
+            len(header) == OFFSET_SIZE and
+            struct.unpack(OFFSET_FORMAT, header)[0] == len(self.__data)
+        )
+
+    def __build_index(self):
+        '''
+        Stores the offset of every puzzle line in the index file.  Offsets are written
+        in blocks, and the index only replaces an old one once it is complete.
+        '''
+        data = self.__data
+        temp_file = '%s.%s.tmp' % (self.__index_file, os.getpid())
+
+        with open(temp_file, 'wb') as fh_out:
+            fh_out.write(struct.pack(OFFSET_FORMAT, len(data)))
+
+            offsets = []
+            start = 0
+            while start < len(data):
+                end = data.find('\n', start)
+                if end == -1:
+                    end = len(data)
+
+                if parse_puzzle_line(data[start:end]) is not None:
+                    offsets.append(start)
+                    if len(offsets) == 65536:
+                        fh_out.write(struct.pack('<%sQ' % (len(offsets)), *offsets))
+                        offsets = []
+
+                start = end + 1
+
+            fh_out.write(struct.pack('<%sQ' % (len(offsets)), *offsets))
+
+        os.rename(temp_file, self.__index_file)
+
+    def __read_puzzle(self, position):
+        ''' Reads the puzzle at position straight from the memory mapped corpus '''
+        start = struct.unpack_from(OFFSET_FORMAT, self.__index, (position + 1) * OFFSET_SIZE)[0]
+        end = self.__data.find('\n', start)
+        if end == -1:
+            end = len(self.__data)
+        return parse_puzzle_line(self.__data[start:end], self.__box_size)
+
+
+def read_puzzles(file_name, box_size=3):
+    '''
+    Reads a file with one puzzle per line, yielding each puzzle as soon as its line is
+    read so the whole file never has to fit in memory.  Files compressed with gzip are
+    read directly.  Empty lines and lines starting with # are skipped.
+
+    :param file_name:  String
+    :param box_size:  Integer - Number of rows and columns in a block
+
+    :yield:  List of Strings - Rows of the puzzle, which can be passed to Sudoku as data
+    '''
+    fh_in = open_corpus(file_name)
+    try:
+        for line in fh_in:
+            rows = parse_puzzle_line(line, box_size)
+            if rows is not None:
+                yield rows
+    finally:
+        fh_in.close()
+
+
+def parse_puzzle_line(line, box_size=3):
+    '''
+    Splits a single line puzzle into its rows.  The puzzle is the first field of the
+    line, with one character per cell and a period or 0 for unknown positions, so
+    anything after it such as a rating is ignored.  A puzzle with the wrong number of
+    cells is still split, and Sudoku rejects the rows when they are loaded.
+    Ex: '4.....8.5.3..........7......2.....6.....8.4......1.......6.3.7.5..2.....1.4......'
+
+    :param line:  String
+    :param box_size:  Integer - Number of rows and columns in a block
+
+    :return:  List of Strings, or None if the line does not hold a puzzle
+    '''
+    fields = line.split(None, 1)
+    if not fields or fields[0].startswith('#'):
+        return None
+
+    puzzle = fields[0]
+    square_size = box_size**2
+    return [puzzle[start:start + square_size] for start in xrange(0, len(puzzle), square_size)]
+
+
+def open_corpus(file_name):
+    '''
+    Opens a puzzle file for reading, decompressing it if it was compressed with gzip
+
+    :param file_name:  String
+
+    :return:  File object
+    '''
+    fh_in = open(file_name, 'rb')
+    if fh_in.read(len(GZIP_MAGIC)) != GZIP_MAGIC:
+        fh_in.seek(0)
+        return fh_in
+    fh_in.close()
+
+    # The buffered reader reads lines in large blocks instead of one at a time
+    return io.BufferedReader(gzip.open(file_name, 'rb'))
@@ -0,0 +1,256 @@
+'''.'''
+
+from sudoku_solver.utilities import num_mask
+from sudoku_solver.SudokuTables import get_tables
+
+
+class SudokuDLX(object):
+    '''
+    Exact cover solver that finds sudoku solutions with Algorithm X and Dancing Links.
+
+    Every (cell, number) pair is a row of the exact cover matrix, covering one column
+    for each of the constraints it satisfies:  the cell holds a number, the row holds
+    the number, the column holds the number, and the block holds the number.
+
+    The links are kept in flat lists indexed by node, with node 0 being the root and
+    nodes 1 to the number of constraints being the column headers.  The links for a
+    grid size are built once and copied for every solve.
+    '''
+
+    def __init__(self, size):
+        self.__size = size
+        self.__square_size = size**2
+        self.__cell_count = size**4
+
+        self.__build_links()
+
+    ##################
+    # Public Methods #
+    ##################
+
+    def solve(self, values, candidates=None, limit=1):
+        '''
+        Finds solutions for the grid
+
+        :param values:  List of Integers - Value of every cell in the flat grid, 0 if unknown
+        :param candidates:  List of Integers - Optional bitmask of candidates for every
+                            cell.  Numbers missing from an unknown cell are never tried.
+        :param limit:  Integer - Stops searching after this many solutions are found
+
+        :return:  List of Lists of Integers - Values of every cell for each solution found
+        '''
+        self.__copy_links()
+
+        # Numbers already ruled out for a cell are removed from the matrix
+        if candidates is not None:
+            for index, value in enumerate(values):
+                if not value:
+                    for num in xrange(1, self.__square_size + 1):
+                        if not candidates[index] & num_mask(num):
+                            self.__remove_row(self.__row_id(index, num))
+
+        # Assigned values are chosen before searching
+        covered = set()
+        for index, value in enumerate(values):
+            if value:
+                row_constraints = self.__row_constraints[self.__row_id(index, value)]
+                if covered.intersection(row_constraints):
+                    return []
+                covered.update(row_constraints)
+                for column in row_constraints:
+                    self.__cover(column)
+
+        solutions = []
+        self.__search(list(values), solutions, limit)
+        return solutions
+
+    ###################
+    # Private Methods #
+    ###################
+
+    def __row_id(self, index, num):
+        return index * self.__square_size + num - 1
+
+    def __build_links(self):
+        ''' Builds the links for the full exact cover matrix '''
+        tables = get_tables(self.__size)
+        square_size = self.__square_size
+        cell_count = self.__cell_count
+        column_count = 4 * cell_count
+
+        # The root and column headers
+        left = [column_count] + range(column_count)
+        right = range(1, column_count + 1) + [0]
+        up = range(column_count + 1)
+        down = range(column_count + 1)
+        column_of = range(column_count + 1)
+        row_of = [-1] * (column_count + 1)
+        column_sizes = [0] * (column_count + 1)
+
+        row_constraints = []
+        for index in xrange(cell_count):
+            (row, _), (col, _), (block, _) = tables.cell_unit_positions[index]
+            col -= square_size
+            block -= 2 * square_size
+            for num in xrange(1, square_size + 1):
+                row_id = len(row_constraints)
+                constraints = (
+                    1 + index,
+                    1 + cell_count + row * square_size + num - 1,
+                    1 + 2 * cell_count + col * square_size + num - 1,
+                    1 + 3 * cell_count + block * square_size + num - 1,
+                )
+                row_constraints.append(constraints)
+
+                first = len(left)
+                for offset, column in enumerate(constraints):
+                    node = first + offset
+
+                    # Link the node at the bottom of its column
+                    up.append(up[column])
+                    down.append(column)
+                    down[up[column]] = node
+                    up[column] = node
+
+                    # Link the node into its row
+                    left.append(node - 1 if offset else first + 3)
+                    right.append(node + 1 if offset < 3 else first)
+
+                    column_of.append(column)
+                    row_of.append(row_id)
+                    column_sizes[column] += 1
+
+        self.__row_constraints = tuple(row_constraints)
+        self.__row_nodes = tuple(
+            column_count + 1 + 4 * row_id for row_id in xrange(len(row_constraints))
+        )
+        self.__column_of = column_of
+        self.__row_of = row_of
+        self.__template = (left, right, up, down, column_sizes)
+
+    def __copy_links(self):
+        ''' Starts a solve from a fresh copy of the links '''
+        left, right, up, down, column_sizes = self.__template
+        self.__left = list(left)
+        self.__right = list(right)
+        self.__up = list(up)
+        self.__down = list(down)
+        self.__column_sizes = list(column_sizes)
+
+    def __remove_row(self, row_id):
+        ''' Unlinks every node of the row from its column '''
+        up, down = self.__up, self.__down
+        node = self.__row_nodes[row_id]
+        for node in xrange(node, node + 4):
+            down[up[node]] = down[node]
+            up[down[node]] = up[node]
+            self.__column_sizes[self.__column_of[node]] -= 1
+
+    def __cover(self, column):
+        ''' Removes the column and every row that satisfies it from the matrix '''
+        left, right, up, down = self.__left, self.__right, self.__up, self.__down
+        column_of, column_sizes = self.__column_of, self.__column_sizes
+
+        right[left[column]] = right[column]
+        left[right[column]] = left[column]
+
+        row = down[column]
+        while row != column:
+            node = right[row]
+            while node != row:
+                down[up[node]] = down[node]
+                up[down[node]] = up[node]
+                column_sizes[column_of[node]] -= 1
+                node = right[node]
+            row = down[row]
+
+    def __uncover(self, column):
+        ''' Restores the column and its rows in the reverse order they were removed '''
+        left, right, up, down = self.__left, self.__right, self.__up, self.__down
+        column_of, column_sizes = self.__column_of, self.__column_sizes
+
+        row = up[column]
+        while row != column:
+            node = left[row]
+            while node != row:
+                column_sizes[column_of[node]] += 1
+                down[up[node]] = node
+                up[down[node]] = node
+                node = left[node]
+            row = up[row]
+
+        right[left[column]] = column
+        left[right[column]] = column
+
+    def __search(self, values, solutions, limit):
+        '''
+        Recursively chooses a row for the column with the fewest rows left.
+        Returns True once enough solutions have been found.
+        '''
+        right, down = self.__right, self.__down
+
+        # Every constraint is satisfied, so the values are a solution
+        if right[0] == 0:
+            solutions.append(list(values))
+            return len(solutions) >= limit
+
+        # Choose the column with the fewest rows to branch on
+        column_sizes = self.__column_sizes
+        column = right[0]
+        best_column = column
+        best_size = column_sizes[column]
+        while column and best_size > 1:
+            if column_sizes[column] < best_size:
+                best_column = column
+                best_size = column_sizes[column]
+            column = right[column]
+
+        if not best_size:
+            return False
+
+        self.__cover(best_column)
+
+        row = down[best_column]
+        while row != best_column:
+            row_id = self.__row_of[row]
+            index = row_id // self.__square_size
+            values[index] = row_id % self.__square_size + 1
+
+            node = right[row]
+            while node != row:
+                self.__cover(self.__column_of[node])
+                node = right[node]
+
+            if self.__search(values, solutions, limit):
+                return True
+
+            node = self.__left[row]
+            while node != row:
+                self.__uncover(self.__column_of[node])
+                node = self.__left[node]
+
+            values[index] = 0
+            row = down[row]
+
+        self.__uncover(best_column)
+
+        return False
+
+
+def get_dlx(size):
+    '''
+    Returns the shared exact cover solver for grids with blocks of size x size cells,
+    building it the first time it is requested
+
+    :param size:  Integer - Number of columns and rows in a block
+
+    :return:  SudokuDLX
+    '''
+    try:
+        return DLX_BY_SIZE[size]
+    except KeyError:
+        DLX_BY_SIZE[size] = SudokuDLX(size)
+        return DLX_BY_SIZE[size]
+
+
+DLX_BY_SIZE = {}
@@ -0,0 +1,342 @@
+'''.'''
+
+from sudoku_solver.utilities import candidate_mask, num_mask, mask_nums, cell_index
+from sudoku_solver.SudokuTables import get_tables
+
+
+class SudokuGrid(object):
+    '''
+    Class that stores the values and candidates of every cell in a sudoku grid
+    in two flat lists indexed from 0 to N^4 - 1, row by row.
+
+    It also keeps an index of where each number can still go in every row, column,
+    and block, which is updated on every placement and elimination.  Units are
+    numbered as in SudokuTables.units.
+
+    Once checkpoint() has been called every change is recorded on a trail, so the
+    grid can be rolled back to a checkpoint in time proportional to the number of
+    changes made since then.
+    '''
+
+    # Kinds of changes recorded on the trail
+    __VALUE_CHANGE = 0
+    __CANDIDATES_CHANGE = 1
+
+    def __init__(self, num_list):
+        # Lists filled in by reset(), which are kept and reused by every later puzzle
+        self.__values = []
+        self.__candidates = []
+        self.__placed = []
+        self.__positions = []
+
+        self.reset(num_list)
+
+    def __eq__(self, other):
+        return self.__values == other.__values  # pylint: disable=protected-access
+
+    ##################
+    # Public Methods #
+    ##################
+
+    def reset(self, num_list):
+        '''
+        Replaces the contents of the grid with a new puzzle.  The lists already
+        allocated for the grid are filled in again instead of being replaced.
+
+        :param num_list:  List of Lists of Integers - Rows of the puzzle, with 0 for
+                          unknown positions.  Ex: [[9, 7, 0, ...], [0, 0, 0, ...], ...]
+
+        :return:  None
+        '''
+        # Set the values to what the user passed in
+        self.__store_values(num_list)
+
+        # Make sure the values passed in are in a valid format
+        self.__validate_values()
+
+        # Creates new candidates for every cell, leaving none for assigned cells
+        self.__create_candidate_numbers()
+
+        # Creates the index of assigned numbers and candidate positions in every unit
+        self.__create_unit_index()
+
+        # Changes are only recorded once a checkpoint has been made
+        self.__trail = None
+
+    def box_size(self):
+        '''
+        Returns the number of rows and columns in a block
+
+        :param:  None
+
+        :return:  Integer
+        '''
+        return self.__box_size
+
+    def complete(self):
+        '''
+        Checks if every cell in the grid contains a number.
+
+        :param:  None
+
+        :return:  Boolean
+        '''
+        return 0 not in self.__values
+
+    def get_value(self, index):
+        '''
+        Returns the assigned value for the cell if one exists; otherwise returns 0
+
+        :param index:  Integer - Position of the cell in the flat grid
+
+        :return:  Integer
+        '''
+        return self.__values[index]
+
+    def set_value(self, num, index):
+        '''
+        Sets the number of the cell at index
+
+        :param num:  Integer
+        :param index:  Integer
+
+        :return:  None
+        '''
+        if self.__trail is not None:
+            self.__trail.append((
+                self.__VALUE_CHANGE, index, self.__values[index],
+                tuple(self.__placed[unit] for unit, _ in self.__unit_positions[index]),
+            ))
+
+        self.__values[index] = num
+
+        num_bit = num_mask(num)
+        for unit, _ in self.__unit_positions[index]:
+            self.__placed[unit] |= num_bit
+
+    ##
+    # CANDIDATE METHODS BELOW
+    # Candidates are represented by an integer bitmask where bit n-1 is set
+    # when the number n is still a candidate, for n from 1-N^2
+    ##
+
+    def get_candidates(self, index):
+        '''
+        Returns the candidates of the cell at index
+
+        :param index:  Integer
+
+        :return:  Integer - Bitmask of candidates
+        '''
+        return self.__candidates[index]
+
+    def delete_candidate_number(self, num, index):
+        '''
+        Deletes a number from the candidates of the cell at index
+
+        :param num:  Integer
+        :param index:  Integer
+
+        :return:  None
+        '''
+        num_bit = num_mask(num)
+        if self.__candidates[index] & num_bit:
+            self.__record_candidates(index)
+            self.__candidates[index] ^= num_bit
+            self.__remove_positions(index, num_bit)
+
+    def restrict_candidates(self, mask, index):
+        '''
+        Deletes every candidate of the cell at index that is not in mask
+
+        :param mask:  Integer - Bitmask of the candidates to keep
+        :param index:  Integer
+
+        :return:  None
+        '''
+        removed = self.__candidates[index] & ~mask
+        if removed:
+            self.__record_candidates(index)
+            self.__candidates[index] ^= removed
+            self.__remove_positions(index, removed)
+
+    def clear_candidates(self, index):
+        '''
+        Deletes all candidates of the cell at index
+
+        :param index:  Integer
+
+        :return:  None
+        '''
+        if self.__candidates[index]:
+            self.__record_candidates(index)
+            self.__remove_positions(index, self.__candidates[index])
+            self.__candidates[index] = 0
+
+    ##
+    # UNIT INDEX METHODS BELOW
+    # For every unit and number, the index stores a bitmask of the positions within
+    # the unit where the number is still a candidate.  Position p is the p-th cell
+    # of the unit in SudokuTables.units.
+    ##
+
+    def get_positions(self, unit, num):
+        '''
+        Returns the positions within the unit where num is still a candidate
+
+        :param unit:  Integer - Unit id from SudokuTables
+        :param num:  Integer
+
+        :return:  Integer - Bitmask of positions
+        '''
+        return self.__positions[unit][num]
+
+    def get_placed(self, unit):
+        '''
+        Returns the numbers that have been assigned within the unit
+
+        :param unit:  Integer - Unit id from SudokuTables
+
+        :return:  Integer - Bitmask of numbers
+        '''
+        return self.__placed[unit]
+
+    ##
+    # TRAIL METHODS BELOW
+    ##
+
+    def checkpoint(self):
+        '''
+        Marks the current state of the grid so it can be restored with rollback()
+
+        :param:  None
+
+        :return:  Integer - Mark to pass to rollback()
+        '''
+        if self.__trail is None:
+            self.__trail = []
+        return len(self.__trail)
+
+    def rollback(self, mark):
+        '''
+        Undoes every change made since checkpoint() returned mark
+
+        :param mark:  Integer
+
+        :return:  None
+        '''
+        trail = self.__trail
+        if trail is None or not 0 <= mark <= len(trail):
+            raise ValueError('Invalid checkpoint passed to SudokuGrid object: %s' % (mark))
+
+        while len(trail) > mark:
+            change = trail.pop()
+            if change[0] == self.__VALUE_CHANGE:
+                self.__undo_value(*change[1:])
+            else:
+                self.__undo_candidates(*change[1:])
+
+    ###################
+    # Private Methods #
+    ###################
+
+    def __store_values(self, num_list):
+        ''' Flattens the rows into a single list '''
+        self.__square_size = len(num_list)
+        self.__box_size = int(round(self.__square_size ** 0.5))
+
+        del self.__values[:]
+        for nums in num_list:
+            if len(nums) != self.__square_size:
+                raise ValueError(
+                    'Invalid number of items passed to SudokuGrid object.  '
+                    'Each row must contain %s items.' % (self.__square_size)
+                )
+            self.__values.extend(nums)
+
+    def __validate_values(self):
+        ''' Make sure the values passed in are in a valid format '''
+        if self.__box_size ** 2 != self.__square_size:
+            raise ValueError(
+                'Invalid number of rows passed to SudokuGrid object.  '
+                'Must be a square number.'
+            )
+
+        for num in self.__values:
+            if not 0 <= num <= self.__square_size:
+                raise ValueError(
+                    'Invalid number passed to SudokuGrid object: %s.  '
+                    'Numbers must be between 1 and %s.' % (num, self.__square_size)
+                )
+
+        # Numbers may only be pre-assigned once per row, column, and block
+        size = self.__box_size
+        square_size = self.__square_size
+        units = []
+        for line in xrange(square_size):
+            units.append(self.__values[line * square_size:(line + 1) * square_size])
+            units.append(self.__values[line::square_size])
+        for block_row in xrange(size):
+            for block_col in xrange(size):
+                units.append([
+                    self.__values[cell_index(block_row, block_col, row, col, size)]
+                    for row in xrange(size) for col in xrange(size)
+                ])
+
+        for unit in units:
+            num_list = [num for num in unit if num]
+            if len(set(num_list)) != len(num_list):
+                raise ValueError('Duplicate numbers pre-assigned to SudokuGrid object.')
+
+    def __create_candidate_numbers(self):
+        ''' Creates new candidates for unassigned cells and none for assigned cells '''
+        all_candidates = candidate_mask(self.__box_size)
+        self.__candidates[:] = [0 if num else all_candidates for num in self.__values]
+
+    def __create_unit_index(self):
+        ''' Indexes the assigned numbers and the candidate positions of every unit '''
+        tables = get_tables(self.__box_size)
+        self.__unit_positions = tables.cell_unit_positions
+
+        self.__placed[:] = [0] * len(tables.units)
+        if len(self.__positions) == len(tables.units):
+            for unit_positions in self.__positions:
+                unit_positions[:] = [0] * len(unit_positions)
+        else:
+            self.__positions[:] = [[0] * (self.__square_size + 1) for _ in tables.units]
+
+        for index, num in enumerate(self.__values):
+            for unit, position in self.__unit_positions[index]:
+                if num:
+                    self.__placed[unit] |= num_mask(num)
+                for candidate in mask_nums(self.__candidates[index]):
+                    self.__positions[unit][candidate] |= 1 << position
+
+    def __remove_positions(self, index, mask):
+        ''' Removes the cell from the unit index of every number in mask '''
+        for unit, position in self.__unit_positions[index]:
+            unit_positions = self.__positions[unit]
+            position_bit = ~(1 << position)
+            for num in mask_nums(mask):
+                unit_positions[num] &= position_bit
+
+    def __record_candidates(self, index):
+        ''' Records the candidates of the cell at index before they change '''
+        if self.__trail is not None:
+            self.__trail.append((self.__CANDIDATES_CHANGE, index, self.__candidates[index]))
+
+    def __undo_value(self, index, value, placed):
+        ''' Restores the value of the cell and the assigned numbers of its units '''
+        self.__values[index] = value
+        for (unit, _), unit_placed in zip(self.__unit_positions[index], placed):
+            self.__placed[unit] = unit_placed
+
+    def __undo_candidates(self, index, candidates):
+        ''' Restores the candidates of the cell and adds it back to the unit index '''
+        restored = candidates & ~self.__candidates[index]
+        self.__candidates[index] = candidates
+        for unit, position in self.__unit_positions[index]:
+            unit_positions = self.__positions[unit]
+            position_bit = 1 << position
+            for num in mask_nums(restored):
+                unit_positions[num] |= position_bit
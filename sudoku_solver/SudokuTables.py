@@ -0,0 +1,138 @@
+'''.'''
+
+from sudoku_solver.utilities import double_iter, cell_index
+from sudoku_solver.SudokuCoordinates import SudokuCoordinates
+
+
+class SudokuTables(object):
+    '''
+    Immutable lookup tables that describe the layout of a sudoku grid.
+    Tables are built once and shared, so traversing the grid never allocates.
+
+    cells:  Tuple of every cell's coordinates, indexed by cell index
+    rows, columns, blocks:  Tuples of units, each unit being a tuple of coordinates
+    units:  Tuple of all rows, columns, and blocks, in that order
+    peers:  Tuple indexed by cell index of frozensets holding every other cell
+            in the same row, column, and block
+    cell_units:  Tuple indexed by cell index of (row, column, block) units
+    row_ids, column_ids, block_ids:  Positions of the rows, columns, and blocks in units
+    unit_ids:  Positions of every unit in units
+    cell_unit_positions:  Tuple indexed by cell index of ((unit id, position in unit), ...)
+                          for the cell's row, column, and block
+    block_row_masks, block_col_masks:  Bitmasks of the positions within a block that
+                                       make up each of its rows and columns
+    '''
+
+    def __init__(self, size):
+        self.size = size
+
+        # Coordinates are interned, so cells[i].cell_index == i
+        self.cells = self.__build_cells(size)
+
+        self.rows = tuple(
+            tuple(self.__cell(block_row, block_col, row, col)
+                  for block_col, col in double_iter(size))
+            for block_row, row in double_iter(size)
+        )
+        self.columns = tuple(
+            tuple(self.__cell(block_row, block_col, row, col)
+                  for block_row, row in double_iter(size))
+            for block_col, col in double_iter(size)
+        )
+        self.blocks = tuple(
+            tuple(self.__cell(block_row, block_col, row, col)
+                  for row, col in double_iter(size))
+            for block_row, block_col in double_iter(size)
+        )
+        self.units = self.rows + self.columns + self.blocks
+
+        square_size = size**2
+        self.row_ids = tuple(xrange(0, square_size))
+        self.column_ids = tuple(xrange(square_size, 2 * square_size))
+        self.block_ids = tuple(xrange(2 * square_size, 3 * square_size))
+        self.unit_ids = self.row_ids + self.column_ids + self.block_ids
+
+        self.cell_units = self.__build_cell_units()
+        self.cell_unit_positions = self.__build_cell_unit_positions()
+        self.peers = self.__build_peers()
+
+        self.block_row_masks = tuple(((1 << size) - 1) << (row * size) for row in xrange(size))
+        self.block_col_masks = tuple(
+            sum(1 << (row * size + col) for row in xrange(size)) for col in xrange(size)
+        )
+
+    ###################
+    # Private Methods #
+    ###################
+
+    @staticmethod
+    def __build_cells(size):
+        ''' Creates the coordinates for every cell in row order '''
+        cells = [None] * size**4
+        for block_row, block_col in double_iter(size):
+            for row, col in double_iter(size):
+                index = cell_index(block_row, block_col, row, col, size)
+                cells[index] = SudokuCoordinates(block_row, block_col, row, col, size)
+        return tuple(cells)
+
+    def __cell(self, block_row, block_col, row, col):
+        return self.cells[cell_index(block_row, block_col, row, col, self.size)]
+
+    def __build_cell_units(self):
+        ''' Stores the row, column, and block that each cell belongs to '''
+        size = self.size
+        cell_units = []
+        for coords in self.cells:
+            cell_units.append((
+                self.rows[coords.block_row * size + coords.row],
+                self.columns[coords.block_col * size + coords.col],
+                self.blocks[coords.block_row * size + coords.block_col],
+            ))
+        return tuple(cell_units)
+
+    def __build_cell_unit_positions(self):
+        ''' Stores where each cell is found within its row, column, and block '''
+        size = self.size
+        square_size = size**2
+        cell_unit_positions = []
+        for coords in self.cells:
+            cell_unit_positions.append((
+                (coords.block_row * size + coords.row, coords.block_col * size + coords.col),
+                (square_size + coords.block_col * size + coords.col,
+                 coords.block_row * size + coords.row),
+                (2 * square_size + coords.block_row * size + coords.block_col,
+                 coords.row * size + coords.col),
+            ))
+        return tuple(cell_unit_positions)
+
+    def __build_peers(self):
+        ''' Stores every cell that shares a row, column, or block with each cell '''
+        peers = []
+        for coords, units in zip(self.cells, self.cell_units):
+            unique_coords = set()
+            for unit in units:
+                unique_coords.update(unit)
+            unique_coords.discard(coords)
+            peers.append(frozenset(unique_coords))
+        return tuple(peers)
+
+
+def get_tables(size):
+    '''
+    Returns the shared tables for grids with blocks of size x size cells,
+    building them the first time they are requested
+
+    :param size:  Integer - Number of columns and rows in a block
+
+    :return:  SudokuTables
+    '''
+    try:
+        return TABLES_BY_SIZE[size]
+    except KeyError:
+        TABLES_BY_SIZE[size] = SudokuTables(size)
+        return TABLES_BY_SIZE[size]
+
+
+# Tables for the standard 9x9 grid
+TABLES = SudokuTables(3)
+TABLES_BY_SIZE = {3: TABLES}
@@ -0,0 +1,188 @@
+'''.'''
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+from sudoku_solver.utilities import candidate_mask, num_mask
+
+
+class SudokuTensor(object):
+    '''
+    Constraint propagation on a boolean candidate tensor, computed with NumPy.
+
+    Puzzles are held as tensors of shape (puzzles, rows, columns, numbers), where
+    [k, r, c, n] is set while number n + 1 is still a candidate for the cell at row r
+    and column c of puzzle k.  An assigned cell only has its own number set.
+
+    Eliminating the numbers of assigned cells from their rows, columns, and blocks,
+    naked singles, and hidden singles are each computed for every cell at once as
+    sums over the axes of the tensor, and repeated until nothing changes.
+    '''
+
+    def __init__(self, size):
+        self.__size = size
+        self.__square_size = size**2
+
+        # Bit n-1 of a candidate mask holds the number n
+        self.__bits = numpy.arange(self.__square_size, dtype=numpy.int64)
+        self.__weights = numpy.left_shift(1, self.__bits)
+
+    ##################
+    # Public Methods #
+    ##################
+
+    def propagate(self, values, candidates):
+        '''
+        Runs the eliminations and singles on one puzzle until they stop making changes
+
+        :param values:  List of Integers - Value of every cell in the flat grid, 0 if unknown
+        :param candidates:  List of Integers - Bitmask of candidates for every cell
+
+        :return:  List of Integers - Bitmask of candidates for every cell, with assigned
+                  cells holding only their number, or None if the puzzle has no solution
+        '''
+        tensor = self.to_tensor([values], [candidates])
+        valid = self.reduce(tensor)
+        if not valid[0]:
+            return None
+        return self.to_masks(tensor)[0]
+
+    def to_tensor(self, values_list, candidates_list=None):
+        '''
+        Stacks puzzles into a candidate tensor
+
+        :param values_list:  List of Lists of Integers - Values of every cell for each puzzle
+        :param candidates_list:  List of Lists of Integers - Optional bitmask of candidates
+                                 of every cell for each puzzle.  Unknown cells start with
+                                 every number when it is left out.
+
+        :return:  numpy.ndarray - Boolean tensor of shape (puzzles, rows, columns, numbers)
+        '''
+        if candidates_list is None:
+            all_candidates = candidate_mask(self.__size)
+            masks = numpy.array([
+                [num_mask(value) if value else all_candidates for value in values]
+                for values in values_list
+            ], dtype=numpy.int64)
+        else:
+            masks = numpy.array([
+                [num_mask(value) if value else mask for value, mask in zip(values, candidates)]
+                for values, candidates in zip(values_list, candidates_list)
+            ], dtype=numpy.int64)
+
+        square_size = self.__square_size
+        tensor = numpy.right_shift(masks[..., None], self.__bits) & 1
+        return tensor.astype(bool).reshape(-1, square_size, square_size, square_size)
+
+    def to_masks(self, tensor):
+        '''
+        Converts a candidate tensor back into bitmasks
+
+        :param tensor:  numpy.ndarray - Boolean tensor of shape (puzzles, rows, columns, numbers)
+
+        :return:  List of Lists of Integers - Bitmask of candidates of every cell for each puzzle
+        '''
+        flat = tensor.reshape(len(tensor), -1, self.__square_size)
+        return (flat * self.__weights).sum(axis=-1).tolist()
+
+    def reduce(self, tensor):
+        '''
+        Removes candidates from the tensor in place until no more can be removed.
+        Candidates are only ever removed, so the loop always ends.
+
+        :param tensor:  numpy.ndarray - Boolean tensor of shape (puzzles, rows, columns, numbers)
+
+        :return:  numpy.ndarray - Boolean array that is False for every puzzle found
+                  to have no solution
+        '''
+        while True:
+            previous = tensor.copy()
+
+            # Numbers of assigned cells are removed from every other cell that sees them
+            singles = tensor & (tensor.sum(axis=-1) == 1)[..., None]
+            seen = self.__unit_sums(singles) - 3 * singles
+            tensor &= seen == 0
+
+            # A number with a single position left in a row, column, or block goes there
+            hidden = tensor & (self.__unit_sums(tensor, 1) > 0)
+            has_hidden = hidden.any(axis=-1)
+            tensor[has_hidden] = hidden[has_hidden]
+
+            if numpy.array_equal(tensor, previous):
+                break
+
+        return self.__valid(tensor)
+
+    ###################
+    # Private Methods #
+    ###################
+
+    def __unit_sums(self, tensor, count=None):
+        '''
+        Counts each number in the row, column, and block of every cell.  Without count
+        the three totals are added together, otherwise each total is compared to count
+        and the matches are counted instead.
+        '''
+        size = self.__size
+        shape = tensor.shape
+
+        rows = tensor.sum(axis=-2, dtype=numpy.int16, keepdims=True)
+        columns = tensor.sum(axis=-3, dtype=numpy.int16, keepdims=True)
+
+        # Split the rows and columns into (block row, row, block column, column)
+        blocks = tensor.reshape(shape[:-3] + (size, size, size, size, shape[-1]))
+        blocks = blocks.sum(axis=(-4, -2), dtype=numpy.int16, keepdims=True)
+        blocks = numpy.broadcast_to(blocks, shape[:-3] + (size,) * 4 + shape[-1:]).reshape(shape)
+
+        if count is None:
+            return rows + columns + blocks
+        return (
+            (rows == count).astype(numpy.int16) +
+            (columns == count) +
+            (blocks == count)
+        )
+
+    def __valid(self, tensor):
+        '''
+        Finds the puzzles where every cell still has a candidate, every number has a
+        position left in every row, column, and block, and no cell is the only position
+        for two different numbers
+        '''
+        cell_axes = (1, 2)
+
+        valid = tensor.any(axis=-1).all(axis=cell_axes)
+        valid &= tensor.any(axis=-2).all(axis=cell_axes)
+        valid &= tensor.any(axis=-3).all(axis=cell_axes)
+
+        size = self.__size
+        blocks = tensor.reshape((len(tensor), size, size, size, size, self.__square_size))
+        valid &= blocks.any(axis=(2, 4)).all(axis=(1, 2, 3))
+
+        hidden = tensor & (self.__unit_sums(tensor, 1) > 0)
+        valid &= (hidden.sum(axis=-1) <= 1).all(axis=cell_axes)
+
+        return valid
+
+
+def get_tensor(size):
+    '''
+    Returns the shared tensor engine for grids with blocks of size x size cells,
+    building it the first time it is requested
+
+    :param size:  Integer - Number of columns and rows in a block
+
+    :return:  SudokuTensor, or None if NumPy is not installed
+    '''
+    if numpy is None:
+        return None
+
+    try:
+        return TENSOR_BY_SIZE[size]
+    except KeyError:
+        TENSOR_BY_SIZE[size] = SudokuTensor(size)
+        return TENSOR_BY_SIZE[size]
+
+
+TENSOR_BY_SIZE = {}
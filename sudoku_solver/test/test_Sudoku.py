@@ -2,7 +2,9 @@
 
 import unittest
 import tempfile
-from sudoku_solver.Sudoku import Sudoku, MissingArguments
+from sudoku_solver.Sudoku import Sudoku, MissingArguments, Contradiction
+from sudoku_solver.SudokuTensor import get_tensor
+from sudoku_solver.utilities import parse_num
 
 
 class TestSudoku(unittest.TestCase):
@@ -245,6 +247,19 @@ class TestSudoku(unittest.TestCase):
         sudokuObj.solve()
         self.assertTrue(sudokuObj.complete())
 
+    # A file can also hold the whole puzzle on a single line
+    def test_singleLineFileLoad(self):
+        fh = tempfile.NamedTemporaryFile()
+        fh.write(
+            '97.652..8...7395.6563481279627340000815967423439210000.56873....9.52.......19....\n',
+        )
+        fh.seek(0)
+        sudokuObj = Sudoku(file=fh.name)
+        self.assertEqual(sudokuObj.get_cell_value(0, 0, 0, 0), 9)
+        self.assertEqual(sudokuObj.get_cell_value(2, 2, 2, 0), 0)
+        sudokuObj.solve()
+        self.assertTrue(sudokuObj.complete())
+
     # Test that the __eq__ method returns True for the same data sets
     def test_eq(self):
         data1 = [
@@ -428,10 +443,471 @@ class TestSudoku(unittest.TestCase):
         self.assertTrue(sudokuObj1.get_cell_value(2, 0, 0, 2), 4)
         self.assertTrue(sudokuObj1.get_cell_value(1, 1, 0, 1), 5)
 
+    # Values and candidates are integers, with 0 for unknown cells
+    def test_getCellValueInteger(self):
+        startData = [
+            ['4', ' ', ' ', '3', ' ', '8', ' ', ' ', '7'],
+            [' ', '1', ' ', ' ', '7', '9', ' ', '4', ' '],
+            [' ', ' ', ' ', '6', ' ', '4', ' ', ' ', ' '],
+            [' ', '3', ' ', ' ', ' ', '7', ' ', '9', ' '],
+            ['6', '4', '8', '1', '9', '3', '2', '7', '5'],
+            [' ', '7', ' ', ' ', ' ', '2', ' ', '1', ' '],
+            [' ', ' ', ' ', '9', ' ', '5', ' ', ' ', ' '],
+            [' ', '2', ' ', '7', '4', '1', ' ', '3', ' '],
+            ['1', ' ', ' ', '8', ' ', '6', ' ', ' ', '4'],
+        ]
+        sudokuObj = Sudoku(data=startData)
+
+        self.assertEqual(sudokuObj.get_cell_value(0, 0, 0, 0), 4)
+        self.assertEqual(sudokuObj.get_cell_value(0, 0, 0, 1), 0)
+        self.assertEqual(sudokuObj.get_cell_candidates(0, 0, 0, 1), set([5, 6, 9]))
+        self.assertEqual(sudokuObj.get_cell_candidates(0, 0, 0, 0), set())
+
+    # Placements made inside a technique must reach their peers before the
+    # technique reads the grid again
+    def test_solvePlacementInsideTechnique(self):
+        startData = [
+            [' ', ' ', ' ', ' ', ' ', '7', ' ', '2', '5'],
+            [' ', '1', '4', ' ', ' ', ' ', ' ', ' ', ' '],
+            [' ', ' ', ' ', ' ', '8', ' ', '4', '7', ' '],
+            [' ', ' ', ' ', '3', ' ', ' ', '1', '8', ' '],
+            ['8', ' ', ' ', '2', ' ', ' ', ' ', '9', ' '],
+            [' ', '3', '6', ' ', '1', ' ', ' ', ' ', ' '],
+            [' ', ' ', ' ', '9', '3', ' ', ' ', ' ', ' '],
+            ['6', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' '],
+            [' ', ' ', ' ', ' ', '7', ' ', '2', '1', '4'],
+        ]
+
+        solvedData = [
+            ['3', '6', '8', '1', '4', '7', '9', '2', '5'],
+            ['7', '1', '4', '5', '9', '2', '8', '3', '6'],
+            ['2', '5', '9', '6', '8', '3', '4', '7', '1'],
+            ['4', '2', '5', '3', '6', '9', '1', '8', '7'],
+            ['8', '7', '1', '2', '5', '4', '6', '9', '3'],
+            ['9', '3', '6', '7', '1', '8', '5', '4', '2'],
+            ['1', '4', '2', '9', '3', '5', '7', '6', '8'],
+            ['6', '8', '7', '4', '2', '1', '3', '5', '9'],
+            ['5', '9', '3', '8', '7', '6', '2', '1', '4'],
+        ]
+
+        self.__validateSolver(startData, solvedData)
+
+    # An easy puzzle only needs singles, so no other technique should be credited
+    def test_solveSinglesOnly(self):
+        fh = tempfile.NamedTemporaryFile()
+        sudokuObj = Sudoku(data=self.__easyPuzzle())
+        sudokuObj.solve(techniques=['Singles'])
+        self.assertTrue(sudokuObj.complete())
+
+        sudokuObj.print_techniques_used(fh)
+        fh.seek(0)
+        self.assertEqual(fh.read(), 'Candidates Removed By:\n\n')
+
+    # Requires hidden singles that only show up within a block
+    def test_solveBlockSingles(self):
+        sudokuObj = Sudoku(data=[
+            [' ', ' ', ' ', '8', ' ', ' ', ' ', '5', '4'],
+            ['8', ' ', ' ', ' ', '5', ' ', ' ', '3', ' '],
+            ['1', ' ', '4', '2', ' ', '7', ' ', ' ', ' '],
+            ['3', ' ', '8', '9', ' ', ' ', '5', ' ', '2'],
+            ['9', '6', ' ', ' ', ' ', '2', '3', ' ', ' '],
+            [' ', ' ', ' ', ' ', '7', ' ', ' ', ' ', '1'],
+            [' ', '8', ' ', '6', ' ', ' ', '4', ' ', ' '],
+            [' ', '1', ' ', ' ', ' ', '3', '7', '8', '9'],
+            ['4', ' ', '3', ' ', ' ', ' ', ' ', ' ', ' '],
+        ])
+        sudokuObj.solve(techniques=['Singles'])
+        self.assertTrue(sudokuObj.complete())
+
+    def test_solveGivenOrder(self):
+        sudokuObj = Sudoku(data=self.__easyPuzzle())
+        sudokuObj.solve(techniques=['Naked Pairs', 'Singles'], order='given')
+        self.assertTrue(sudokuObj.complete())
+
+    def test_solveUnknownTechnique(self):
+        sudokuObj = Sudoku(data=self.__easyPuzzle())
+        with self.assertRaises(ValueError):
+            sudokuObj.solve(techniques=['Guessing'])
+        with self.assertRaises(ValueError):
+            sudokuObj.solve(order='random')
+
+    # Rolling back after solving restores the puzzle as it was loaded
+    def test_rollback(self):
+        sudokuObj = Sudoku(data=self.__easyPuzzle())
+        startValues = sudokuObj.grid_values()
+        startCandidates = sudokuObj.get_cell_candidates(0, 0, 2, 0)
+
+        mark = sudokuObj.checkpoint()
+        sudokuObj.solve()
+        self.assertTrue(sudokuObj.complete())
+
+        sudokuObj.rollback(mark)
+        self.assertEqual(sudokuObj.grid_values(), startValues)
+        self.assertEqual(sudokuObj.get_cell_candidates(0, 0, 2, 0), startCandidates)
+
+        # The restored puzzle can still be solved
+        sudokuObj.solve()
+        self.assertTrue(sudokuObj.complete())
+
+    # Logic alone stalls on this puzzle, searching fills in the rest
+    def test_solveSearch(self):
+        sudokuObj = Sudoku(data=self.__hardPuzzle())
+        sudokuObj.solve(techniques=['Singles'])
+        self.assertFalse(sudokuObj.complete())
+
+        sudokuObj.solve(techniques=['Singles'], search=True)
+        self.assertTrue(sudokuObj.complete())
+
+    # The extra given leaves the puzzle without any solution, which only the search finds
+    def test_solveSearchNoSolution(self):
+        data = self.__hardPuzzle()
+        data[0][1] = '2'
+        sudokuObj = Sudoku(data=data)
+        sudokuObj.solve(techniques=['Singles'])
+        self.assertFalse(sudokuObj.complete())
+
+        with self.assertRaises(Contradiction):
+            sudokuObj.solve(techniques=['Singles'], search=True)
+
+    def test_solveDLX(self):
+        sudokuObj1 = Sudoku(data=self.__hardPuzzle())
+        sudokuObj1.solve(engine='dlx')
+        self.assertTrue(sudokuObj1.complete())
+
+        sudokuObj2 = Sudoku(data=self.__hardPuzzle())
+        sudokuObj2.solve(techniques=['Singles'], search=True)
+        self.assertEqual(sudokuObj1, sudokuObj2)
+
+        with self.assertRaises(ValueError):
+            sudokuObj1.solve(engine='guess')
+
+    # The extra given leaves the puzzle without any solution
+    def test_solveDLXNoSolution(self):
+        data = self.__hardPuzzle()
+        data[0][1] = '2'
+        with self.assertRaises(Contradiction):
+            Sudoku(data=data).solve(engine='dlx')
+
+    # The tensor engine finds the same values as the logic engine
+    def test_solveTensor(self):
+        sudokuObj1 = Sudoku(data=self.__hardPuzzle())
+        sudokuObj1.solve(engine='tensor', search=True)
+        self.assertTrue(sudokuObj1.complete())
+
+        sudokuObj2 = Sudoku(data=self.__hardPuzzle())
+        sudokuObj2.solve(search=True)
+        self.assertEqual(sudokuObj1, sudokuObj2)
+
+    # Results are yielded in order, each with the status of its own puzzle
+    def test_solveMany(self):
+        contradiction = [[' '] * 9 for _ in xrange(9)]
+        contradiction[0][0:8] = ['1', '2', '3', '4', '5', '6', '7', '8']
+        contradiction[4][8] = '9'
+
+        grids = [
+            self.__easyPuzzle(),
+            self.__hardPuzzle(),
+            contradiction,
+            [['1', '2'], ['3', '4']],
+            self.__easyPuzzle(),
+            self.__repeatedRows(),
+        ]
+        results = list(Sudoku.solve_many(grids, techniques=['Singles']))
+
+        self.assertEqual(
+            [result.status for result in results],
+            ['solved', 'unsolved', 'contradiction', 'invalid', 'solved', 'invalid'],
+        )
+
+        sudokuObj = Sudoku(data=self.__easyPuzzle())
+        sudokuObj.solve(techniques=['Singles'])
+        self.assertEqual(results[0].solution, sudokuObj.grid_values())
+        self.assertEqual(results[4].solution, sudokuObj.grid_values())
+        self.assertIsNone(results[2].solution)
+
+        sudokuObj = Sudoku(data=self.__hardPuzzle())
+        sudokuObj.solve(techniques=['Singles'])
+        self.assertEqual(results[1].solution, sudokuObj.grid_values())
+
+    # Stacking puzzles on the tensor gives the same results as solving them one at a time
+    @unittest.skipIf(get_tensor(3) is None, 'NumPy is not installed')
+    def test_solveManyTensorBatch(self):
+        contradiction = [[' '] * 9 for _ in xrange(9)]
+        contradiction[0][0:8] = ['1', '2', '3', '4', '5', '6', '7', '8']
+        contradiction[4][8] = '9'
+
+        duplicate = self.__easyPuzzle()
+        duplicate[1][1] = '4'
+
+        grids = [
+            self.__easyPuzzle(),
+            self.__hardPuzzle(),
+            contradiction,
+            [['1', '2'], ['3', '4']],
+            duplicate,
+            self.__easyPuzzle(),
+            self.__repeatedRows(),
+        ]
+        expected = [
+            (result.solution, result.status, result.techniques_used)
+            for result in Sudoku.solve_many(grids, techniques=['Singles', 'Naked Pairs'])
+        ]
+        results = [
+            (result.solution, result.status, result.techniques_used)
+            for result in Sudoku.solve_many(
+                grids, batch_size=4, techniques=['Singles', 'Naked Pairs'], engine='tensor',
+            )
+        ]
+        self.assertEqual(results, expected)
+        self.assertEqual(
+            [status for _, status, _ in results],
+            ['solved', 'unsolved', 'contradiction', 'invalid', 'invalid', 'solved', 'invalid'],
+        )
+
+        # Singles alone finish this puzzle, so it stays unsolved when they are left out
+        grids = [
+            self.__easyPuzzle(),
+            [
+                '.....7.25', '.14......', '....8.47.', '...3..18.', '8..2...9.',
+                '.36.1....', '...93....', '6........', '....7.214',
+            ],
+        ]
+        expected = [
+            (result.solution, result.status, result.techniques_used)
+            for result in Sudoku.solve_many(grids, techniques=['Candidate Lines'])
+        ]
+        results = [
+            (result.solution, result.status, result.techniques_used)
+            for result in Sudoku.solve_many(
+                grids, techniques=['Candidate Lines'], engine='tensor',
+            )
+        ]
+        self.assertEqual(results, expected)
+        self.assertEqual([status for _, status, _ in results], ['solved', 'unsolved'])
+
+    # Puzzles are read from the iterable one at a time
+    def test_solveManyLazy(self):
+        def grids():
+            yield self.__hardPuzzle()
+            raise AssertionError('Read past the first puzzle')
+
+        result = next(Sudoku.solve_many(grids(), search=True))
+        self.assertEqual(result.status, 'solved')
+        self.assertTrue(result.techniques_used)
+        self.assertGreaterEqual(result.seconds, 0)
+
+    def test_countSolutions(self):
+        sudokuObj = Sudoku(data=self.__hardPuzzle())
+        self.assertEqual(sudokuObj.count_solutions(), 1)
+        self.assertTrue(sudokuObj.has_unique_solution())
+
+        # Counting does not change the puzzle
+        self.assertFalse(sudokuObj.complete())
+
+    def test_countSolutionsLimit(self):
+        data = self.__hardPuzzle()
+        data[0][0] = ' '
+        data[8][6] = ' '
+        sudokuObj = Sudoku(data=data)
+        self.assertEqual(sudokuObj.count_solutions(limit=5), 5)
+        self.assertEqual(sudokuObj.count_solutions(), 2)
+        self.assertFalse(sudokuObj.has_unique_solution())
+
+    # Eliminations already made are reused when counting
+    def test_countSolutionsAfterSolve(self):
+        sudokuObj = Sudoku(data=self.__hardPuzzle())
+        sudokuObj.solve(techniques=['Singles', 'Candidate Lines'])
+        self.assertEqual(sudokuObj.count_solutions(), 1)
+
+    # Singles alone stall on this puzzle, hidden pairs and trios finish it
+    def test_solveHiddenSets(self):
+        fh = tempfile.NamedTemporaryFile()
+        sudokuObj = Sudoku(data=[
+            ['4', ' ', ' ', '3', ' ', '8', ' ', ' ', '7'],
+            [' ', '1', ' ', ' ', '7', ' ', ' ', '4', ' '],
+            [' ', ' ', ' ', '6', ' ', '4', ' ', ' ', ' '],
+            [' ', '3', ' ', ' ', ' ', ' ', ' ', '9', ' '],
+            ['6', ' ', '8', ' ', '9', ' ', '2', ' ', '5'],
+            [' ', '7', ' ', ' ', ' ', ' ', ' ', '1', ' '],
+            [' ', ' ', ' ', '9', ' ', '5', ' ', ' ', ' '],
+            [' ', '2', ' ', ' ', '4', ' ', ' ', '3', ' '],
+            ['1', ' ', ' ', '8', ' ', '6', ' ', ' ', '4'],
+        ])
+        sudokuObj.solve(techniques=['Singles', 'Hidden Pairs', 'Hidden Trios'])
+        self.assertTrue(sudokuObj.complete())
+
+        sudokuObj.print_techniques_used(fh)
+        fh.seek(0)
+        self.assertEqual(
+            fh.read(),
+            'Candidates Removed By:\n  Hidden Pairs: 10\n  Hidden Trios: 7\n\n',
+        )
+
+    # Every technique other than the chains stalls on these puzzles
+    def test_solveXCycles(self):
+        fh = tempfile.NamedTemporaryFile()
+        data = [
+            [' ', ' ', '9', ' ', ' ', '1', ' ', ' ', ' '],
+            ['7', '1', ' ', ' ', '8', ' ', ' ', ' ', '2'],
+            [' ', ' ', '3', '7', ' ', ' ', ' ', ' ', ' '],
+            [' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', '4'],
+            [' ', ' ', '2', ' ', ' ', '4', '8', '9', ' '],
+            ['4', ' ', ' ', '9', '1', ' ', ' ', ' ', ' '],
+            [' ', ' ', ' ', ' ', '5', '9', ' ', ' ', ' '],
+            [' ', '3', ' ', ' ', ' ', ' ', ' ', '2', '1'],
+            [' ', '6', ' ', ' ', ' ', '8', '3', ' ', ' '],
+        ]
+        sudokuObj = Sudoku(data=data)
+        sudokuObj.solve(techniques=Sudoku.TECHNIQUES[:-3])
+        self.assertFalse(sudokuObj.complete())
+
+        sudokuObj = Sudoku(data=data)
+        sudokuObj.solve(techniques=['Singles', 'X-Cycles'])
+        self.assertTrue(sudokuObj.complete())
+
+        sudokuObj.print_techniques_used(fh)
+        fh.seek(0)
+        self.assertEqual(fh.read(), 'Candidates Removed By:\n  X-Cycles: 8\n\n')
+
+        # Alternating inference chains include the X-Cycles
+        sudokuObj = Sudoku(data=data)
+        sudokuObj.solve(techniques=['Singles', 'Alternating Inference Chains'])
+        self.assertTrue(sudokuObj.complete())
+
+    def test_solveXYChains(self):
+        fh = tempfile.NamedTemporaryFile()
+        data = [
+            [' ', ' ', ' ', '1', ' ', '4', ' ', ' ', '2'],
+            [' ', ' ', ' ', ' ', '6', '2', ' ', ' ', ' '],
+            ['5', '2', ' ', ' ', ' ', ' ', '8', ' ', ' '],
+            [' ', ' ', '3', ' ', '7', ' ', ' ', '9', ' '],
+            ['8', ' ', '1', ' ', ' ', ' ', ' ', '3', ' '],
+            [' ', '7', ' ', ' ', ' ', ' ', ' ', ' ', '5'],
+            ['2', ' ', ' ', '3', ' ', ' ', ' ', '6', '4'],
+            [' ', ' ', ' ', ' ', ' ', '9', ' ', ' ', ' '],
+            [' ', ' ', '5', ' ', ' ', '8', ' ', '1', '9'],
+        ]
+        sudokuObj = Sudoku(data=data)
+        sudokuObj.solve(techniques=Sudoku.TECHNIQUES[:-3])
+        self.assertFalse(sudokuObj.complete())
+
+        sudokuObj = Sudoku(data=data)
+        sudokuObj.solve(techniques=['Singles', 'XY-Chains'])
+        self.assertTrue(sudokuObj.complete())
+
+        sudokuObj.print_techniques_used(fh)
+        fh.seek(0)
+        self.assertEqual(fh.read(), 'Candidates Removed By:\n  XY-Chains: 5\n\n')
+
+    # Removing the last candidate of a cell is a contradiction
+    def test_solveContradiction(self):
+        data = [[' '] * 9 for _ in xrange(9)]
+        data[0][0:8] = ['1', '2', '3', '4', '5', '6', '7', '8']
+        data[4][8] = '9'
+        with self.assertRaises(Contradiction):
+            Sudoku(data=data).solve()
+
+    def test_solveSmallBox(self):
+        data = [
+            ['1', ' ', ' ', ' '],
+            [' ', ' ', '3', ' '],
+            [' ', '4', ' ', ' '],
+            [' ', ' ', ' ', '2'],
+        ]
+        sudokuObj = Sudoku(data=data, box_size=2)
+        sudokuObj.solve()
+        self.assertEqual(
+            sudokuObj.grid_values(),
+            [
+                ['1', '3', '2', '4'],
+                ['4', '2', '3', '1'],
+                ['2', '4', '1', '3'],
+                ['3', '1', '4', '2'],
+            ],
+        )
+
+    # Numbers above 9 are written as letters, A being 10
+    def test_solveLargeBox(self):
+        data = self.__largePuzzle()
+        sudokuObj = Sudoku(data=data, box_size=4)
+        sudokuObj.solve(techniques=['Singles'])
+        self.assertTrue(sudokuObj.complete())
+        self.assertEqual(sudokuObj.grid_values()[0][0], 'A')
+        self.assertEqual(sudokuObj.grid_values()[15][11], '8')
+        self.assertEqual(sudokuObj.get_cell_value(0, 0, 2, 3), 11)
+
+    # Lines separated by commas allow numbers with more than one digit
+    def test_largeBoxFileLoad(self):
+        fh = tempfile.NamedTemporaryFile()
+        for row in self.__largePuzzle():
+            fh.write('%s\n' % (','.join(str(parse_num(num) or '') for num in row)))
+        fh.seek(0)
+        sudokuObj1 = Sudoku(file=fh.name, box_size=4)
+        sudokuObj2 = Sudoku(data=self.__largePuzzle(), box_size=4)
+        self.assertEqual(sudokuObj1, sudokuObj2)
+
+    def test_boxSizeMismatch(self):
+        with self.assertRaises(ValueError):
+            Sudoku(data=self.__easyPuzzle(), box_size=2)
+
     ###################
     # Private Methods #
     ###################
 
+    @staticmethod
+    def __largePuzzle():
+        return [
+            list('.57GFE23CB1D8694'),
+            list('1234B.DG689A57EF'),
+            list('689B1A574E.G23CD'),
+            list('CDEF468923571BA.'),
+            list('2713.4G8DAE5BF69'),
+            list('8GFA253B9.C4D17E'),
+            list('BECD916F72G345.A'),
+            list('495.D7EA1F8BG23C'),
+            list('E321AB94.7DFCG56'),
+            list('GB8532FCA961E.47'),
+            list('D6.9587E3G2CFAB1'),
+            list('7FAC6G1.B54E3928'),
+            list('31G27F45ECA9.8DB'),
+            list('5.D8G9C2F4B67E13'),
+            list('9C6E83.1GD72A4F5'),
+            list('F4B7EDA6513.9CG2'),
+        ]
+
+    @staticmethod
+    def __easyPuzzle():
+        return [
+            ['4', '5', '2', '3', '1', '8', '9', ' ', '7'],
+            ['3', ' ', '6', '2', '7', '9', '5', '4', '8'],
+            [' ', '8', ' ', '6', ' ', '4', ' ', '2', '1'],
+            ['2', ' ', '1', '5', '8', ' ', '4', ' ', '6'],
+            ['6', '4', '8', ' ', '9', '3', ' ', '7', ' '],
+            [' ', ' ', ' ', '4', '6', '2', '8', ' ', ' '],
+            [' ', ' ', ' ', '9', '3', ' ', '1', ' ', ' '],
+            [' ', '2', '5', '7', ' ', ' ', '6', '3', ' '],
+            ['1', '9', '3', ' ', ' ', ' ', '7', '5', '4'],
+        ]
+
+    # Complete grid where every block holds each number once, but the rows repeat them
+    @staticmethod
+    def __repeatedRows():
+        return ['123123123', '456456456', '789789789'] * 3
+
+    @staticmethod
+    def __hardPuzzle():
+        return [
+            ['1', ' ', ' ', ' ', ' ', '7', ' ', '9', ' '],
+            [' ', '3', ' ', ' ', '2', ' ', ' ', ' ', '8'],
+            [' ', ' ', '9', '6', ' ', ' ', '5', ' ', ' '],
+            [' ', ' ', '5', '3', ' ', ' ', '9', ' ', ' '],
+            [' ', '1', ' ', ' ', '8', ' ', ' ', ' ', '2'],
+            ['6', ' ', ' ', ' ', ' ', '4', ' ', ' ', ' '],
+            ['3', ' ', ' ', ' ', ' ', ' ', ' ', '1', ' '],
+            [' ', '4', ' ', ' ', ' ', ' ', ' ', ' ', '7'],
+            [' ', ' ', '7', ' ', ' ', ' ', '3', ' ', ' '],
+        ]
+
     def __validateSolver(self, startData, solvedData):
         sudokuObj1 = Sudoku(data=startData)
         sudokuObj1.solve()
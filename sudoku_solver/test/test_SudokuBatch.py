@@ -0,0 +1,62 @@
+import unittest
+from itertools import islice
+from sudoku_solver.SudokuBatch import solve_batch
+from sudoku_solver.SudokuCorpus import parse_puzzle_line
+
+
+class TestSudokuBatch(unittest.TestCase):
+    def setUp(self):
+        self.grids = [
+            parse_puzzle_line(line) for line in [
+                '97.652..8...7395.6563481279627340000815967423439210000.56873....9.52.......19....',
+                '452318967306279548080604021201580406648093070000462800000930100025700630193000754',
+                '12345678.........9...............................................................',
+                '123',
+                '4.....8.5.3..........7......2.....6.....8.4......1.......6.3.7.5..2.....1.4......',
+            ]
+        ] * 3
+
+    def test_solveBatchInProcess(self):
+        results = list(solve_batch(self.grids, techniques=['Singles']))
+        self.assertEqual([index for index, _ in results], range(15))
+        self.assertEqual(
+            [result.status for _, result in results[:5]],
+            ['unsolved', 'solved', 'contradiction', 'invalid', 'unsolved'],
+        )
+
+    # Every process gives the same results as solving in this process
+    def test_solveBatchPool(self):
+        expected = [
+            (index, result.solution, result.status)
+            for index, result in solve_batch(self.grids, techniques=['Singles'])
+        ]
+        results = [
+            (index, result.solution, result.status)
+            for index, result in solve_batch(
+                self.grids, jobs=2, chunk_size=2, techniques=['Singles'],
+            )
+        ]
+        self.assertEqual(results, expected)
+
+    def test_solveBatchUnordered(self):
+        expected = [
+            (index, result.status)
+            for index, result in solve_batch(self.grids, techniques=['Singles'])
+        ]
+        results = [
+            (index, result.status)
+            for index, result in solve_batch(
+                self.grids, jobs=2, chunk_size=4, ordered=False, techniques=['Singles'],
+            )
+        ]
+        self.assertEqual(sorted(results), expected)
+
+    # The pool shuts down when the results stop being read early
+    def test_solveBatchClosed(self):
+        results = solve_batch(self.grids * 20, jobs=2, chunk_size=1, techniques=['Singles'])
+        self.assertEqual([index for index, _ in islice(results, 3)], [0, 1, 2])
+        results.close()
+
+    def test_solveBatchChunkSize(self):
+        with self.assertRaises(ValueError):
+            list(solve_batch(self.grids, jobs=2, chunk_size=0))
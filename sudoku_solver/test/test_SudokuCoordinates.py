@@ -1,3 +1,4 @@
+import pickle
 import unittest
 from sudoku_solver.SudokuCoordinates import SudokuCoordinates
 
@@ -49,3 +50,23 @@ class TestSudokuBlock(unittest.TestCase):
         scObj1 = SudokuCoordinates(0, 0, 0, 0)
         scObj2 = SudokuCoordinates(0, 0, 0, 1)
         self.assertFalse(scObj1.aligns_by_col(scObj2))
+
+    # The same coordinates always return the same object
+    def test_interned(self):
+        scObj1 = SudokuCoordinates(1, 2, 0, 1)
+        scObj2 = SudokuCoordinates(1, 2, 0, 1)
+        self.assertIs(scObj1, scObj2)
+        self.assertEqual(len(set([scObj1, scObj2])), 1)
+
+    def test_cellIndex(self):
+        self.assertEqual(SudokuCoordinates(0, 0, 0, 0).cell_index, 0)
+        self.assertEqual(SudokuCoordinates(1, 2, 0, 1).cell_index, 34)
+        self.assertEqual(SudokuCoordinates(2, 2, 2, 2).cell_index, 80)
+
+    def test_slots(self):
+        scObj1 = SudokuCoordinates(0, 0, 0, 0)
+        self.assertFalse(hasattr(scObj1, '__dict__'))
+
+    def test_pickle(self):
+        scObj1 = SudokuCoordinates(2, 1, 0, 2)
+        self.assertIs(pickle.loads(pickle.dumps(scObj1)), scObj1)
@@ -0,0 +1,146 @@
+import os
+import gzip
+import shutil
+import unittest
+import tempfile
+from sudoku_solver.SudokuCorpus import SudokuCorpus, read_puzzles, parse_puzzle_line
+
+
+class TestSudokuCorpus(unittest.TestCase):
+    def setUp(self):
+        self.puzzle1 = (
+            '97.652..8...7395.6563481279627340000815967423439210000.56873....9.52.......19....'
+        )
+        self.puzzle2 = (
+            '4.....8.5.3..........7......2.....6.....8.4......1.......6.3.7.5..2.....1.4......'
+        )
+        self.text = '# Two puzzles\n%s\n\n%s 4.5\n' % (self.puzzle1, self.puzzle2)
+
+    def test_parsePuzzleLine(self):
+        self.assertEqual(
+            parse_puzzle_line(self.puzzle1 + '\n'),
+            [
+                '97.652..8', '...7395.6', '563481279',
+                '627340000', '815967423', '439210000',
+                '.56873...', '.9.52....', '...19....',
+            ],
+        )
+
+    # Anything after the puzzle, such as a rating, is ignored
+    def test_parsePuzzleLineExtraFields(self):
+        self.assertEqual(
+            parse_puzzle_line(self.puzzle2 + ' 4.5\n'),
+            parse_puzzle_line(self.puzzle2),
+        )
+
+    def test_parsePuzzleLineSkipped(self):
+        self.assertIsNone(parse_puzzle_line('\n'))
+        self.assertIsNone(parse_puzzle_line('# Comment\n'))
+
+    def test_parsePuzzleLineBoxSize(self):
+        self.assertEqual(parse_puzzle_line('1...3.....4....2', 2), ['1...', '3...', '..4.', '...2'])
+
+    def test_readPuzzles(self):
+        fh = tempfile.NamedTemporaryFile()
+        fh.write(self.text)
+        fh.flush()
+
+        self.assertEqual(
+            list(read_puzzles(fh.name)),
+            [parse_puzzle_line(self.puzzle1), parse_puzzle_line(self.puzzle2)],
+        )
+
+    def test_readPuzzlesGzip(self):
+        fh = tempfile.NamedTemporaryFile(suffix='.gz')
+        fh_gzip = gzip.GzipFile(fileobj=fh, mode='wb')
+        fh_gzip.write(self.text)
+        fh_gzip.close()
+        fh.flush()
+
+        self.assertEqual(
+            list(read_puzzles(fh.name)),
+            [parse_puzzle_line(self.puzzle1), parse_puzzle_line(self.puzzle2)],
+        )
+
+
+class TestSudokuCorpusIndex(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.fileName = os.path.join(self.directory, 'corpus.txt')
+
+        # Puzzles only differ by their first cell, which holds their position
+        self.lines = ['%s%s' % (num, '.' * 80) for num in xrange(1, 8)]
+        with open(self.fileName, 'wb') as fh:
+            fh.write('# Seven puzzles\r\n%s\r\n\r\n%s 4.5' % (
+                '\r\n'.join(self.lines[:5]), '\n'.join(self.lines[5:]),
+            ))
+
+        self.corpusObj = SudokuCorpus(self.fileName)
+
+    def tearDown(self):
+        self.corpusObj.close()
+        shutil.rmtree(self.directory)
+
+    def test_len(self):
+        self.assertEqual(len(self.corpusObj), 7)
+
+    def test_getItem(self):
+        self.assertEqual(self.corpusObj[0], parse_puzzle_line(self.lines[0]))
+        self.assertEqual(self.corpusObj[6], parse_puzzle_line(self.lines[6]))
+        self.assertEqual(self.corpusObj[-2], parse_puzzle_line(self.lines[5]))
+        with self.assertRaises(IndexError):
+            self.corpusObj[7]
+
+    def test_slice(self):
+        self.assertEqual(
+            self.corpusObj[1:6:2],
+            [parse_puzzle_line(line) for line in self.lines[1:6:2]],
+        )
+
+    def test_iter(self):
+        self.assertEqual(list(self.corpusObj), list(read_puzzles(self.fileName)))
+
+    # The shards hold every puzzle once, in order
+    def test_shard(self):
+        self.assertEqual(
+            [self.corpusObj.shard_bounds(shardId, 3) for shardId in xrange(3)],
+            [(0, 2), (2, 4), (4, 7)],
+        )
+        puzzles = []
+        for shardId in xrange(3):
+            puzzles.extend(self.corpusObj.shard(shardId, 3))
+        self.assertEqual(puzzles, list(self.corpusObj))
+
+        with self.assertRaises(ValueError):
+            self.corpusObj.shard_bounds(3, 3)
+
+    # The index is reused while the corpus is unchanged, and rebuilt once it changes
+    def test_index(self):
+        indexFile = self.fileName + '.idx'
+        self.assertTrue(os.path.exists(indexFile))
+
+        # Whole seconds survive the round trip through the file system exactly
+        indexTime = int(os.path.getmtime(self.fileName)) + 10
+        os.utime(indexFile, (0, indexTime))
+        with SudokuCorpus(self.fileName) as corpusObj:
+            self.assertEqual(len(corpusObj), 7)
+        self.assertEqual(os.path.getmtime(indexFile), indexTime)
+
+        with open(self.fileName, 'ab') as fh:
+            fh.write('\n%s\n' % (self.lines[0]))
+        with SudokuCorpus(self.fileName) as corpusObj:
+            self.assertEqual(len(corpusObj), 8)
+            self.assertEqual(corpusObj[7], corpusObj[0])
+
+    def test_emptyCorpus(self):
+        open(self.fileName, 'wb').close()
+        with SudokuCorpus(self.fileName) as corpusObj:
+            self.assertEqual(len(corpusObj), 0)
+            self.assertEqual(list(corpusObj), [])
+
+    def test_compressedCorpus(self):
+        fh = gzip.open(self.fileName, 'wb')
+        fh.write(self.lines[0])
+        fh.close()
+        with self.assertRaises(ValueError):
+            SudokuCorpus(self.fileName)
@@ -0,0 +1,60 @@
+import unittest
+from sudoku_solver.SudokuDLX import get_dlx
+from sudoku_solver.utilities import num_mask
+
+
+def nums_to_mask(nums):
+    ''' Returns the candidate bitmask with every number in nums set '''
+    return sum(num_mask(num) for num in set(nums))
+
+
+class TestSudokuDLX(unittest.TestCase):
+    def setUp(self):
+        self.dlxObj = get_dlx(3)
+        self.puzzle = [
+            1, 0, 0, 0, 0, 7, 0, 9, 0,
+            0, 3, 0, 0, 2, 0, 0, 0, 8,
+            0, 0, 9, 6, 0, 0, 5, 0, 0,
+            0, 0, 5, 3, 0, 0, 9, 0, 0,
+            0, 1, 0, 0, 8, 0, 0, 0, 2,
+            6, 0, 0, 0, 0, 4, 0, 0, 0,
+            3, 0, 0, 0, 0, 0, 0, 1, 0,
+            0, 4, 0, 0, 0, 0, 0, 0, 7,
+            0, 0, 7, 0, 0, 0, 3, 0, 0,
+        ]
+        self.solution = [
+            1, 6, 2, 8, 5, 7, 4, 9, 3,
+            5, 3, 4, 1, 2, 9, 6, 7, 8,
+            7, 8, 9, 6, 4, 3, 5, 2, 1,
+            4, 7, 5, 3, 1, 2, 9, 8, 6,
+            9, 1, 3, 5, 8, 6, 7, 4, 2,
+            6, 2, 8, 7, 9, 4, 1, 3, 5,
+            3, 5, 6, 4, 7, 8, 2, 1, 9,
+            2, 4, 1, 9, 3, 5, 8, 6, 7,
+            8, 9, 7, 2, 6, 1, 3, 5, 4,
+        ]
+
+    def test_sharedInstance(self):
+        self.assertIs(get_dlx(3), self.dlxObj)
+
+    def test_solve(self):
+        self.assertEqual(self.dlxObj.solve(self.puzzle), [self.solution])
+
+    # The links are copied for every solve, so solving again gives the same answer
+    def test_solveRepeated(self):
+        self.dlxObj.solve(self.puzzle)
+        self.assertEqual(self.dlxObj.solve(self.puzzle), [self.solution])
+
+    def test_solveLimit(self):
+        self.assertEqual(len(self.dlxObj.solve(self.puzzle, limit=2)), 1)
+        self.assertEqual(len(self.dlxObj.solve([0] * 81, limit=3)), 3)
+
+    # Candidates rule out numbers before searching
+    def test_solveCandidates(self):
+        candidates = [0 if num else nums_to_mask(range(1, 10)) for num in self.puzzle]
+        candidates[1] = nums_to_mask([2, 4])
+        self.assertEqual(self.dlxObj.solve(self.puzzle, candidates), [])
+
+    def test_solveDuplicateValues(self):
+        self.puzzle[2] = 1
+        self.assertEqual(self.dlxObj.solve(self.puzzle), [])
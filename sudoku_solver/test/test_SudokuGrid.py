@@ -0,0 +1,151 @@
+import unittest
+from sudoku_solver.SudokuGrid import SudokuGrid
+from sudoku_solver.utilities import num_mask
+
+
+def nums_to_mask(nums):
+    ''' Returns the candidate bitmask with every number in nums set '''
+    return sum(num_mask(num) for num in set(nums))
+
+
+class TestSudokuGrid(unittest.TestCase):
+    def setUp(self):
+        numListStart = [
+            [9, 7, 0, 6, 5, 2, 0, 0, 8],
+            [0, 0, 0, 7, 3, 9, 5, 0, 6],
+            [5, 6, 3, 4, 8, 1, 2, 7, 9],
+            [6, 2, 7, 3, 4, 0, 0, 0, 0],
+            [8, 1, 5, 9, 6, 7, 4, 2, 3],
+            [4, 3, 9, 2, 1, 0, 0, 0, 0],
+            [0, 5, 6, 8, 7, 3, 0, 0, 0],
+            [0, 9, 0, 5, 2, 0, 0, 0, 0],
+            [0, 0, 0, 1, 9, 0, 0, 0, 0],
+        ]
+        self.sudokuGridObj = SudokuGrid(numListStart)
+
+    def test_invalid_row_length(self):
+        with self.assertRaises(ValueError):
+            SudokuGrid([[3, 4, 5], [1, 2]])
+
+    def test_invalid_row_count(self):
+        with self.assertRaises(ValueError):
+            SudokuGrid([[1, 2], [3, 4]])
+
+    def test_duplicate_num_load(self):
+        with self.assertRaises(ValueError):
+            SudokuGrid([
+                [1, 0, 0, 0],
+                [0, 1, 0, 0],
+                [0, 0, 0, 0],
+                [0, 0, 0, 0],
+            ])
+
+    def test_duplicate_num_row_load(self):
+        with self.assertRaises(ValueError):
+            SudokuGrid([
+                [1, 0, 1, 0],
+                [0, 0, 0, 0],
+                [0, 0, 0, 0],
+                [0, 0, 0, 0],
+            ])
+
+    def test_duplicate_num_column_load(self):
+        with self.assertRaises(ValueError):
+            SudokuGrid([
+                [1, 0, 0, 0],
+                [0, 0, 0, 0],
+                [1, 0, 0, 0],
+                [0, 0, 0, 0],
+            ])
+
+    # Resetting loads a new puzzle and forgets every change made to the old one
+    def test_reset(self):
+        self.sudokuGridObj.checkpoint()
+        self.sudokuGridObj.set_value(4, 2)
+        self.sudokuGridObj.reset([[0] * 9 for _ in xrange(9)])
+
+        self.assertEqual(0, self.sudokuGridObj.get_value(0))
+        self.assertEqual(self.sudokuGridObj.get_candidates(2), nums_to_mask(range(1, 10)))
+        self.assertEqual(self.sudokuGridObj.get_positions(0, 1), 0b111111111)
+        self.assertEqual(self.sudokuGridObj.get_placed(0), 0)
+        with self.assertRaises(ValueError):
+            self.sudokuGridObj.rollback(0)
+
+    def test_boxSize(self):
+        self.assertEqual(self.sudokuGridObj.box_size(), 3)
+
+    # Standard get_value() test on assigned and unknown cells
+    def test_getValue(self):
+        self.assertEqual(9, self.sudokuGridObj.get_value(0))
+        self.assertEqual(8, self.sudokuGridObj.get_value(8))
+        self.assertEqual(0, self.sudokuGridObj.get_value(2))
+
+    def test_setValue(self):
+        self.sudokuGridObj.set_value(4, 2)
+        self.assertEqual(4, self.sudokuGridObj.get_value(2))
+
+    def test_completeFalse(self):
+        self.assertFalse(self.sudokuGridObj.complete())
+
+    # Assigned cells start without candidates, unknown cells start with all of them
+    def test_getCandidates(self):
+        self.assertEqual(self.sudokuGridObj.get_candidates(0), 0)
+        self.assertEqual(self.sudokuGridObj.get_candidates(2), nums_to_mask(range(1, 10)))
+
+    def test_deleteCandidateNumber(self):
+        for num in [1, 3, 5]:
+            self.sudokuGridObj.delete_candidate_number(num, 2)
+        self.assertEqual(
+            self.sudokuGridObj.get_candidates(2),
+            nums_to_mask([2, 4, 6, 7, 8, 9]),
+        )
+
+    def test_clearCandidates(self):
+        self.sudokuGridObj.clear_candidates(2)
+        self.assertEqual(self.sudokuGridObj.get_candidates(2), 0)
+
+    # The unit index tracks where each number can still go in a unit
+    def test_getPositions(self):
+        self.assertEqual(self.sudokuGridObj.get_positions(0, 1), 0b11000100)
+        self.sudokuGridObj.delete_candidate_number(1, 2)
+        self.assertEqual(self.sudokuGridObj.get_positions(0, 1), 0b11000000)
+        self.sudokuGridObj.clear_candidates(6)
+        self.assertEqual(self.sudokuGridObj.get_positions(0, 1), 0b10000000)
+
+    def test_getPlaced(self):
+        self.assertEqual(self.sudokuGridObj.get_placed(0), nums_to_mask([2, 5, 6, 7, 8, 9]))
+        self.sudokuGridObj.set_value(4, 2)
+        self.assertEqual(self.sudokuGridObj.get_placed(0), nums_to_mask([2, 4, 5, 6, 7, 8, 9]))
+
+    # Rolling back restores values, candidates, and the unit index
+    def test_rollback(self):
+        mark = self.sudokuGridObj.checkpoint()
+        self.sudokuGridObj.delete_candidate_number(1, 2)
+        self.sudokuGridObj.set_value(4, 2)
+        self.sudokuGridObj.clear_candidates(2)
+        self.sudokuGridObj.rollback(mark)
+
+        self.assertEqual(0, self.sudokuGridObj.get_value(2))
+        self.assertEqual(self.sudokuGridObj.get_candidates(2), nums_to_mask(range(1, 10)))
+        self.assertEqual(self.sudokuGridObj.get_positions(0, 1), 0b11000100)
+        self.assertEqual(self.sudokuGridObj.get_placed(0), nums_to_mask([2, 5, 6, 7, 8, 9]))
+
+    def test_rollbackNested(self):
+        outer = self.sudokuGridObj.checkpoint()
+        self.sudokuGridObj.set_value(4, 2)
+        inner = self.sudokuGridObj.checkpoint()
+        self.sudokuGridObj.set_value(1, 6)
+
+        self.sudokuGridObj.rollback(inner)
+        self.assertEqual(4, self.sudokuGridObj.get_value(2))
+        self.assertEqual(0, self.sudokuGridObj.get_value(6))
+
+        self.sudokuGridObj.rollback(outer)
+        self.assertEqual(0, self.sudokuGridObj.get_value(2))
+
+    def test_rollbackInvalid(self):
+        with self.assertRaises(ValueError):
+            self.sudokuGridObj.rollback(0)
+        self.sudokuGridObj.checkpoint()
+        with self.assertRaises(ValueError):
+            self.sudokuGridObj.rollback(1)
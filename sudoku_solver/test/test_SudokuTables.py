@@ -0,0 +1,36 @@
+import unittest
+from sudoku_solver.SudokuTables import SudokuTables, TABLES
+from sudoku_solver.SudokuCoordinates import SudokuCoordinates
+
+
+class TestSudokuTables(unittest.TestCase):
+    def setUp(self):
+        pass
+
+    def test_unitCounts(self):
+        self.assertEqual(len(TABLES.cells), 81)
+        self.assertEqual(len(TABLES.units), 27)
+        for unit in TABLES.units:
+            self.assertEqual(len(unit), 9)
+
+    def test_peerCounts(self):
+        for coords, peers in zip(TABLES.cells, TABLES.peers):
+            self.assertEqual(len(peers), 20)
+            self.assertNotIn(coords, peers)
+
+    # Every cell belongs to exactly one row, column, and block
+    def test_cellUnits(self):
+        for coords, units in zip(TABLES.cells, TABLES.cell_units):
+            self.assertEqual(len(units), 3)
+            for unit in units:
+                self.assertIn(coords, unit)
+
+    def test_cellOrder(self):
+        self.assertEqual(TABLES.cells[10], SudokuCoordinates(0, 0, 1, 1))
+        self.assertEqual(TABLES.rows[4][8], SudokuCoordinates(1, 2, 1, 2))
+        self.assertEqual(TABLES.columns[4][8], SudokuCoordinates(2, 1, 2, 1))
+
+    def test_smallGrid(self):
+        tables = SudokuTables(2)
+        self.assertEqual(len(tables.units), 12)
+        self.assertEqual(len(tables.peers[0]), 7)
@@ -0,0 +1,74 @@
+import unittest
+from sudoku_solver.SudokuTensor import get_tensor, numpy
+from sudoku_solver.utilities import num_mask
+
+
+def nums_to_mask(nums):
+    ''' Returns the candidate bitmask with every number in nums set '''
+    return sum(num_mask(num) for num in set(nums))
+
+
+@unittest.skipIf(numpy is None, 'NumPy is not installed')
+class TestSudokuTensor(unittest.TestCase):
+    def setUp(self):
+        self.tensorObj = get_tensor(3)
+        self.puzzle = [
+            4, 5, 2, 3, 1, 8, 9, 0, 7,
+            3, 0, 6, 2, 7, 9, 5, 4, 8,
+            0, 8, 0, 6, 0, 4, 0, 2, 1,
+            2, 0, 1, 5, 8, 0, 4, 0, 6,
+            6, 4, 8, 0, 9, 3, 0, 7, 0,
+            0, 0, 0, 4, 6, 2, 8, 0, 0,
+            0, 0, 0, 9, 3, 0, 1, 0, 0,
+            0, 2, 5, 7, 0, 0, 6, 3, 0,
+            1, 9, 3, 0, 0, 0, 7, 5, 4,
+        ]
+        self.solution = [
+            4, 5, 2, 3, 1, 8, 9, 6, 7,
+            3, 1, 6, 2, 7, 9, 5, 4, 8,
+            9, 8, 7, 6, 5, 4, 3, 2, 1,
+            2, 3, 1, 5, 8, 7, 4, 9, 6,
+            6, 4, 8, 1, 9, 3, 2, 7, 5,
+            5, 7, 9, 4, 6, 2, 8, 1, 3,
+            7, 6, 4, 9, 3, 5, 1, 8, 2,
+            8, 2, 5, 7, 4, 1, 6, 3, 9,
+            1, 9, 3, 8, 2, 6, 7, 5, 4,
+        ]
+        self.candidates = [0 if num else nums_to_mask(range(1, 10)) for num in self.puzzle]
+
+    def test_sharedInstance(self):
+        self.assertIs(get_tensor(3), self.tensorObj)
+
+    # Singles are enough to fill in every cell of this puzzle
+    def test_propagate(self):
+        self.assertEqual(
+            self.tensorObj.propagate(self.puzzle, self.candidates),
+            [nums_to_mask([num]) for num in self.solution],
+        )
+
+    # Cells that can not be filled in keep the candidates that were not ruled out
+    def test_propagateEmpty(self):
+        masks = self.tensorObj.propagate([0] * 81, [nums_to_mask(range(1, 10))] * 81)
+        self.assertEqual(masks, [nums_to_mask(range(1, 10))] * 81)
+
+    def test_propagateContradiction(self):
+        self.candidates[7] = nums_to_mask([1, 2])
+        self.assertIsNone(self.tensorObj.propagate(self.puzzle, self.candidates))
+
+    def test_propagateDuplicateValues(self):
+        self.puzzle[7] = 4
+        self.assertIsNone(self.tensorObj.propagate(self.puzzle, self.candidates))
+
+    # Every puzzle in a stack is reduced and checked on its own
+    def test_reduceStack(self):
+        bad = list(self.puzzle)
+        bad[7] = 4
+        tensor = self.tensorObj.to_tensor(
+            [self.puzzle, bad],
+            [self.candidates, self.candidates],
+        )
+        self.assertEqual(self.tensorObj.reduce(tensor).tolist(), [True, False])
+        self.assertEqual(
+            self.tensorObj.to_masks(tensor)[0],
+            [nums_to_mask([num]) for num in self.solution],
+        )
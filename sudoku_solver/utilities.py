@@ -1,22 +1,6 @@
 '''.'''
 
 
-def instantiate_matrix(size):
-    '''
-    Creates a size x size matrix
-
-    :param size:  Integer - Number of columns and rows
-
-    :return:  List of Lists
-    '''
-    matrix = []
-    for i in xrange(size):
-        matrix.append([])
-        for _ in xrange(size):
-            matrix[i].append([])
-    return matrix
-
-
 def double_iter(num):
     '''
     Iterator returns pairs of numbers
@@ -30,38 +14,117 @@ def double_iter(num):
             yield i, j
 
 
-def number_set(size):
+def cell_index(block_row, block_col, row, col, size=3):  # pylint: disable=too-many-arguments
+    '''
+    Converts block/cell coordinates into the position of the cell in a flat grid
+
+    :param block_row:  Integer
+    :param block_col:  Integer
+    :param row:  Integer
+    :param col:  Integer
+    :param size:  Integer - Number of columns and rows in a block
+
+    :return:  Integer from 0 to size^4 - 1
+    '''
+    return (block_row * size + row) * size**2 + block_col * size + col
+
+
+def parse_num(value):
+    '''
+    Converts a value read from a puzzle into the integer used by the solver.
+    Numbers may be written with digits or with the letters in SYMBOLS, so '16' and 'G'
+    are both 16.  Anything else is an unknown position and becomes 0.
+
+    :param value:  String or Integer - Ex: '7', ' ', '.', 7, '12', 'C'
+
+    :return:  Integer
+    '''
+    value = str(value).strip().upper()
+    if value.isdigit():
+        return int(value)
+    if len(value) == 1 and value in SYMBOLS:
+        return SYMBOLS.index(value) + 1
+    return 0
+
+
+def num_symbol(num):
+    '''
+    Returns the single character used to write a number, digits up to 9
+    followed by letters
+
+    :param num:  Integer - Ex: 7, 16
+
+    :return:  String - Ex: '7', 'G'
     '''
-    Returns a set of numbers from 1 to size^2
+    return SYMBOLS[num - 1]
+
+
+# Characters used to write the numbers 1 to 35, in order
+SYMBOLS = '123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+
+##
+# CANDIDATE MASK METHODS BELOW
+# Candidates are stored as integer bitmasks where bit n-1 is set when the
+# number n is still a candidate.  For a 9x9 grid the full mask is 0b111111111.
+##
+
+def candidate_mask(size):
+    '''
+    Returns a bitmask with every number from 1 to size^2 set
 
     :param size:  Integer - Number of columns and rows
 
-    :return:  Set of Strings from 1 to size^2
+    :return:  Integer
     '''
+    return (1 << (size**2)) - 1
 
-    num_list = []
-    for i in cell_id_iter(size):
-        num_list.append(i)
-    return set(num_list)
 
+def num_mask(num):
+    '''
+    Returns the bitmask for a single number
 
-def num_dict_list(size):
+    :param num:  Integer
+
+    :return:  Integer
     '''
-    Returns a dictionary with keys being numbers 1-size^2 and values as empty lists
+    return 1 << (num - 1)
+
+
+def mask_nums(mask):
+    '''
+    Yields the numbers set in a bitmask, lowest first
+
+    :param mask:  Integer
+
+    :yield:  Integers
+    '''
+    while mask:
+        low_bit = mask & -mask
+        yield low_bit.bit_length()
+        mask ^= low_bit
+
+
+def mask_indexes(mask):
+    '''
+    Yields the positions of the bits set in a bitmask, lowest first
+
+    :param mask:  Integer
+
+    :yield:  Integers starting from 0
     '''
-    dict_list = {}
-    for i in cell_id_iter(size):
-        dict_list[i] = []
-    return dict_list
+    while mask:
+        low_bit = mask & -mask
+        yield low_bit.bit_length() - 1
+        mask ^= low_bit
 
 
-def cell_id_iter(size):
+def bit_count(mask):
     '''
-    Yields strings of numbers from 1 to size^2
+    Returns the number of bits set in a bitmask
 
-    :param size:  Integer
+    :param mask:  Integer
 
-    :yield:  Strings from 1 to size^2
+    :return:  Integer
     '''
-    for i in map(str, xrange(1, (size**2)+1)):
-        yield i
+    return bin(mask).count('1')